@@ -1,9 +1,19 @@
 import csv
 import io
+import os
+import re
+import secrets
+import tempfile
+import zipfile
 from datetime import datetime, timezone
 
+import orjson
 from fastapi import APIRouter, Query, Request
-from sqlalchemy import and_, func, or_
+from fastapi.concurrency import run_in_threadpool
+from openpyxl.writer.excel import ExcelWriter
+from sqlalchemy import and_, bindparam, delete, func, insert, or_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import selectinload
 
 try:
     from .core import *  # noqa: F403
@@ -45,7 +55,7 @@ def decode_audit_cursor(cursor: str) -> tuple[datetime, str]:
         raise HTTPException(status_code=400, detail="cursor is invalid")
     date_part, item_id = value.split("|", 1)
     parsed = parse_iso_datetime(date_part, "cursor")
-    if not item_id:
+    if not is_uuid_text(item_id):
         raise HTTPException(status_code=400, detail="cursor is invalid")
     return parsed, item_id
 
@@ -88,6 +98,23 @@ def parse_page_args(page: int, page_size: int) -> tuple[int, int, int]:
     return safe_page, safe_page_size, offset
 
 
+def apply_list_window(stmt, skip: int, limit: int | None):
+    """Optional pagination for list endpoints; the defaults keep the full result set."""
+    if skip:
+        stmt = stmt.offset(skip)
+    if limit is not None:
+        stmt = stmt.limit(limit)
+    return stmt
+
+
+def user_id_by_email(db: Session, email: str, exclude_user_id: str | None = None) -> str | None:
+    """Existence check that fetches only the id instead of hydrating a User row."""
+    stmt = select(User.id).where(User.email == email)
+    if exclude_user_id:
+        stmt = stmt.where(User.id != exclude_user_id)
+    return db.scalar(stmt)
+
+
 def parse_sort_direction(sort_dir: str) -> str:
     value = (sort_dir or "asc").strip().lower()
     if value not in ("asc", "desc"):
@@ -109,19 +136,24 @@ def user_to_out(user: User) -> AdminUserOut:
 @router.post("/api/auth/register", response_model=AuthOut)
 def register(payload: AuthRegisterIn, _: User = Depends(require_admin_access), db: Session = Depends(get_db)):
     normalized_email = normalize_login_identity(payload.email)
-    existing = db.scalar(select(User).where(User.email == normalized_email))
-    if existing:
-        raise HTTPException(status_code=409, detail="User already exists")
-
-    user = User(
-        email=normalized_email,
-        password_hash=hash_password(payload.password),
-        role=payload.role.value,
-        preferred_language="en",
+    # Insert atomically; a conflicting email yields no row instead of a
+    # check-then-insert race.
+    stmt = (
+        pg_insert(User)
+        .values(
+            email=normalized_email,
+            password_hash=hash_password(payload.password),
+            role=payload.role.value,
+            preferred_language="en",
+        )
+        .on_conflict_do_nothing()
+        .returning(User)
     )
-    db.add(user)
+    user = db.scalars(stmt).first()
+    if not user:
+        db.rollback()
+        raise HTTPException(status_code=409, detail="User already exists")
     db.commit()
-    db.refresh(user)
     return AuthOut(
         token=create_access_token(user),
         user_email=user.email,
@@ -134,10 +166,16 @@ def register(payload: AuthRegisterIn, _: User = Depends(require_admin_access), d
 def login(payload: AuthLoginIn, db: Session = Depends(get_db)):
     normalized_email = normalize_login_identity(payload.email)
     user = db.scalar(select(User).where(User.email == normalized_email))
-    if not user or not verify_password(payload.password, user.password_hash):
+    if not user:
+        raise HTTPException(status_code=401, detail="Invalid credentials")
+    valid, new_hash = verify_and_update_password(payload.password, user.password_hash)
+    if not valid:
         raise HTTPException(status_code=401, detail="Invalid credentials")
     if user.must_set_password:
         raise HTTPException(status_code=403, detail="Account activation required. Use your activation link to set a password.")
+    if new_hash:
+        user.password_hash = new_hash
+        db.commit()
     return AuthOut(
         token=create_access_token(user),
         user_email=user.email,
@@ -198,7 +236,6 @@ def activate_account(payload: AuthActivateIn, request: Request, db: Session = De
     user.activation_token_hash = None
     user.activation_expires_at = None
     db.commit()
-    db.refresh(user)
     write_audit_log(
         db,
         actor=user,
@@ -337,19 +374,26 @@ def list_users_paginated(
 @router.post("/api/admin/users", response_model=AdminCreateUserOut)
 def create_user(payload: AdminCreateUserIn, request: Request, current_admin: User = Depends(require_admin_access), db: Session = Depends(get_db)):
     normalized_email = normalize_login_identity(payload.email)
-    existing = db.scalar(select(User).where(User.email == normalized_email))
-    if existing:
-        raise HTTPException(status_code=409, detail="User already exists")
-
-    user = User(
-        email=normalized_email,
-        password_hash=hash_password(generate_activation_token()),
-        role=payload.role.value,
+    activation_token = generate_activation_token()
+    activation_expires_at = datetime.now(timezone.utc) + timedelta(minutes=60)
+    stmt = (
+        pg_insert(User)
+        .values(
+            email=normalized_email,
+            password_hash=hash_password(generate_activation_token()),
+            role=payload.role.value,
+            must_set_password=True,
+            activation_token_hash=hash_activation_token(activation_token),
+            activation_expires_at=activation_expires_at,
+        )
+        .on_conflict_do_nothing()
+        .returning(User)
     )
-    activation_token, activation_expires_at = issue_activation_for_user(user)
-    db.add(user)
+    user = db.scalars(stmt).first()
+    if not user:
+        db.rollback()
+        raise HTTPException(status_code=409, detail="User already exists")
     db.commit()
-    db.refresh(user)
     write_audit_log(
         db,
         actor=current_admin,
@@ -381,12 +425,11 @@ def update_user(
     current_admin: User = Depends(require_admin_access),
     db: Session = Depends(get_db),
 ):
-    user = db.get(User, user_id)
+    user = get_by_uuid(db, User, user_id)
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
     normalized_email = normalize_login_identity(payload.email)
-    existing = db.scalar(select(User).where(User.email == normalized_email, User.id != user_id))
-    if existing:
+    if user_id_by_email(db, normalized_email, exclude_user_id=user_id):
         raise HTTPException(status_code=409, detail="Email already in use")
     before = {"email": user.email, "role": user.role}
     user.email = normalized_email
@@ -394,7 +437,6 @@ def update_user(
         raise HTTPException(status_code=400, detail="Cannot downgrade your own admin role")
     user.role = payload.role.value
     db.commit()
-    db.refresh(user)
     changed = diff_fields(before, {"email": user.email, "role": user.role})
     write_audit_log(
         db,
@@ -425,7 +467,7 @@ def reset_user_password(
     current_admin: User = Depends(require_admin_access),
     db: Session = Depends(get_db),
 ):
-    user = db.get(User, user_id)
+    user = get_by_uuid(db, User, user_id)
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
     next_password = (payload.password or "").strip()
@@ -457,7 +499,7 @@ def generate_user_activation_link(
     current_admin: User = Depends(require_admin_access),
     db: Session = Depends(get_db),
 ):
-    user = db.get(User, user_id)
+    user = get_by_uuid(db, User, user_id)
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
     activation_token, activation_expires_at = issue_activation_for_user(user)
@@ -483,7 +525,7 @@ def generate_user_activation_link(
 
 @router.delete("/api/admin/users/{user_id}")
 def delete_user(user_id: str, request: Request, current_admin: User = Depends(require_admin_access), db: Session = Depends(get_db)):
-    user = db.get(User, user_id)
+    user = get_by_uuid(db, User, user_id)
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
     if user.id == current_admin.id:
@@ -538,10 +580,18 @@ def bulk_delete_users(
     return BulkDeleteOut(deleted=len(deleted_ids))
 
 
+def _linked_user_emails(db: Session, people: list[Person]) -> dict[str, str]:
+    user_ids = [person.user_id for person in people if person.user_id]
+    if not user_ids:
+        return {}
+    return dict(db.execute(select(User.id, User.email).where(User.id.in_(user_ids))).all())
+
+
 @router.get("/api/admin/people", response_model=list[PersonOut])
 def list_people(_: User = Depends(require_admin_access), db: Session = Depends(get_db)):
     items = db.scalars(select(Person).order_by(Person.name.asc())).all()
-    return [person_to_out(item) for item in items]
+    linked_emails = _linked_user_emails(db, items)
+    return [person_to_out(item, db, linked_emails) for item in items]
 
 
 @router.get("/api/admin/people/list", response_model=PersonListOut)
@@ -597,8 +647,9 @@ def list_people_paginated(
         people_stmt = people_stmt.order_by(sort_column.desc(), Person.id.desc())
     items = db.scalars(people_stmt.offset(offset).limit(safe_page_size)).all()
     total = int(db.scalar(total_stmt) or 0)
+    linked_emails = _linked_user_emails(db, items)
     return PersonListOut(
-        items=[person_to_out(item) for item in items],
+        items=[person_to_out(item, db, linked_emails) for item in items],
         total=total,
         page=safe_page,
         pageSize=safe_page_size,
@@ -610,10 +661,13 @@ def generate_placeholder_email(name: str, db: Session) -> str:
     if not base:
         base = "user"
     candidate = f"{base}@tdcon40.com"
-    exists = db.scalar(select(User).where(User.email == candidate))
-    if exists:
-        raise HTTPException(status_code=409, detail="Generated username already exists for this name; provide email manually")
-    return candidate
+    # On collision, retry with a short random suffix instead of failing the
+    # whole person create; the unique index on users.email backstops races.
+    for _ in range(3):
+        if not user_id_by_email(db, candidate):
+            return candidate
+        candidate = f"{base}-{secrets.token_hex(2)}@tdcon40.com"
+    raise HTTPException(status_code=409, detail="Generated username already exists for this name; provide email manually")
 
 
 def resolve_person_user_email(raw_email: str, name: str, db: Session, exclude_user_id: str | None = None) -> str:
@@ -621,18 +675,14 @@ def resolve_person_user_email(raw_email: str, name: str, db: Session, exclude_us
     if not value:
         return generate_placeholder_email(name, db)
     normalized = normalize_login_identity(value)
-    query = select(User).where(User.email == normalized)
-    if exclude_user_id:
-        query = query.where(User.id != exclude_user_id)
-    existing = db.scalar(query)
-    if existing:
+    if user_id_by_email(db, normalized, exclude_user_id=exclude_user_id):
         raise HTTPException(status_code=409, detail="User email already exists")
     return normalized
 
 
 @router.post("/api/admin/people", response_model=PersonOut)
 def create_person(payload: PersonIn, request: Request, current_admin: User = Depends(require_admin_access), db: Session = Depends(get_db)):
-    name = payload.name.strip()
+    name = payload.name
     if not name:
         raise HTTPException(status_code=400, detail="name is required")
     department = normalize_department(payload.department)
@@ -641,12 +691,12 @@ def create_person(payload: PersonIn, request: Request, current_admin: User = Dep
         role_id=2,
         client_id=1,
         name=name,
-        email=payload.email.strip().lower(),
-        title=payload.title.strip(),
+        email=payload.email,
+        title=payload.title,
         role=payload.role.value,
         job_department=department,
-        mobile=payload.mobile.strip(),
-        notes=payload.notes.strip(),
+        mobile=payload.mobile,
+        notes=payload.notes,
         lang="en",
     )
     db.add(item)
@@ -663,7 +713,6 @@ def create_person(payload: PersonIn, request: Request, current_admin: User = Dep
     db.flush()
     item.user_id = linked_user.id
     db.commit()
-    db.refresh(item)
     write_audit_log(
         db,
         actor=current_admin,
@@ -683,7 +732,7 @@ def create_person(payload: PersonIn, request: Request, current_admin: User = Dep
         request_id=get_request_id(request),
         ip_address=get_request_ip(request),
     )
-    person_out = person_to_out(item)
+    person_out = person_to_out(item, db)
     return person_out.model_copy(
         update={
             "activationToken": activation_token,
@@ -700,10 +749,10 @@ def update_person(
     current_admin: User = Depends(require_admin_access),
     db: Session = Depends(get_db),
 ):
-    item = db.get(Person, person_id)
+    item = get_by_uuid(db, Person, person_id)
     if not item:
         raise HTTPException(status_code=404, detail="Person not found")
-    name = payload.name.strip()
+    name = payload.name
     if not name:
         raise HTTPException(status_code=400, detail="name is required")
     before = {
@@ -718,19 +767,19 @@ def update_person(
     }
     department = normalize_department(payload.department)
     item.name = name
-    item.email = payload.email.strip().lower()
-    item.title = payload.title.strip()
+    item.email = payload.email
+    item.title = payload.title
     item.role = payload.role.value
     item.job_department = department
-    item.mobile = payload.mobile.strip()
-    item.notes = payload.notes.strip()
+    item.mobile = payload.mobile
+    item.notes = payload.notes
     activation_token: str | None = None
     activation_expires_at: datetime | None = None
     if item.user_id:
         linked_user = db.get(User, item.user_id)
         if linked_user:
             linked_user.role = payload.role.value
-            if payload.email.strip():
+            if payload.email:
                 linked_user.email = resolve_person_user_email(payload.email, name, db, exclude_user_id=linked_user.id)
     else:
         linked_user = User(
@@ -745,7 +794,6 @@ def update_person(
         item.user_id = linked_user.id
     item.updated_at = datetime.now(timezone.utc)
     db.commit()
-    db.refresh(item)
     after = {
         "name": item.name,
         "email": item.email,
@@ -773,7 +821,7 @@ def update_person(
         request_id=get_request_id(request),
         ip_address=get_request_ip(request),
     )
-    person_out = person_to_out(item)
+    person_out = person_to_out(item, db)
     if activation_token and activation_expires_at:
         return person_out.model_copy(
             update={
@@ -786,7 +834,7 @@ def update_person(
 
 @router.delete("/api/admin/people/{person_id}")
 def delete_person(person_id: str, request: Request, current_admin: User = Depends(require_admin_access), db: Session = Depends(get_db)):
-    item = db.get(Person, person_id)
+    item = get_by_uuid(db, Person, person_id)
     if not item:
         raise HTTPException(status_code=404, detail="Person not found")
     deleted_payload = {
@@ -844,8 +892,14 @@ def bulk_delete_people(
 
 
 @router.get("/api/projects", response_model=list[ProjectOut])
-def list_projects(current_user: User = Depends(require_personal_access), db: Session = Depends(get_db)):
-    projects = db.scalars(select(Project).where(Project.owner_id == current_user.id).order_by(Project.created_at.desc())).all()
+def list_projects(
+    skip: int = Query(default=0, ge=0),
+    limit: int | None = Query(default=None, ge=1, le=500),
+    current_user: User = Depends(require_personal_access),
+    db: Session = Depends(get_db),
+):
+    stmt = select(Project).where(Project.owner_id == current_user.id).order_by(Project.created_at.desc())
+    projects = db.scalars(apply_list_window(stmt, skip, limit)).all()
     return [project_to_out(item) for item in projects]
 
 
@@ -854,7 +908,6 @@ def create_project(payload: ProjectIn, current_user: User = Depends(require_pers
     project = Project(owner_id=current_user.id, name=payload.name, description=payload.description)
     db.add(project)
     db.commit()
-    db.refresh(project)
     return project_to_out(project)
 
 
@@ -869,8 +922,14 @@ def delete_project(project_id: str, current_user: User = Depends(require_persona
 
 
 @router.get("/api/tasks", response_model=list[TaskOut])
-def list_tasks(current_user: User = Depends(require_personal_access), db: Session = Depends(get_db)):
-    tasks = db.scalars(select(Task).where(Task.owner_id == current_user.id).order_by(Task.created_at.desc())).all()
+def list_tasks(
+    skip: int = Query(default=0, ge=0),
+    limit: int | None = Query(default=None, ge=1, le=500),
+    current_user: User = Depends(require_personal_access),
+    db: Session = Depends(get_db),
+):
+    stmt = select(Task).where(Task.owner_id == current_user.id).order_by(Task.created_at.desc())
+    tasks = db.scalars(apply_list_window(stmt, skip, limit)).all()
     return [task_to_out(item) for item in tasks]
 
 
@@ -897,7 +956,6 @@ def create_task(payload: TaskIn, current_user: User = Depends(require_personal_a
     )
     db.add(task)
     db.commit()
-    db.refresh(task)
     return task_to_out(task)
 
 
@@ -910,7 +968,6 @@ def update_task_detail(task_id: str, payload: TaskDetailPatch, current_user: Use
     task.documentation = payload.documentation.strip()
     task.additional_notes = payload.additionalNotes.strip()
     db.commit()
-    db.refresh(task)
     return task_to_out(task)
 
 
@@ -940,8 +997,14 @@ def delete_task(task_id: str, current_user: User = Depends(require_personal_acce
 
 
 @router.get("/api/notes", response_model=list[NoteOut])
-def list_notes(current_user: User = Depends(require_personal_access), db: Session = Depends(get_db)):
-    notes = db.scalars(select(Note).where(Note.owner_id == current_user.id).order_by(Note.created_at.desc())).all()
+def list_notes(
+    skip: int = Query(default=0, ge=0),
+    limit: int | None = Query(default=None, ge=1, le=500),
+    current_user: User = Depends(require_personal_access),
+    db: Session = Depends(get_db),
+):
+    stmt = select(Note).where(Note.owner_id == current_user.id).order_by(Note.created_at.desc())
+    notes = db.scalars(apply_list_window(stmt, skip, limit)).all()
     return [note_to_out(item) for item in notes]
 
 
@@ -950,7 +1013,6 @@ def create_note(payload: NoteIn, current_user: User = Depends(require_personal_a
     note = Note(owner_id=current_user.id, title=payload.title, content=payload.content, note_date=parse_date(payload.noteDate))
     db.add(note)
     db.commit()
-    db.refresh(note)
     return note_to_out(note)
 
 
@@ -965,11 +1027,14 @@ def delete_note(note_id: str, current_user: User = Depends(require_personal_acce
 
 
 @router.get("/api/knowledge-base", response_model=list[KnowledgeArticleOut])
-def list_knowledge_articles(current_user: User = Depends(require_team_work_access), db: Session = Depends(get_db)):
-    articles = db.scalars(
-        select(KnowledgeArticle)
-        .order_by(KnowledgeArticle.updated_at.desc())
-    ).all()
+def list_knowledge_articles(
+    skip: int = Query(default=0, ge=0),
+    limit: int | None = Query(default=None, ge=1, le=500),
+    current_user: User = Depends(require_team_work_access),
+    db: Session = Depends(get_db),
+):
+    stmt = select(KnowledgeArticle).order_by(KnowledgeArticle.updated_at.desc())
+    articles = db.scalars(apply_list_window(stmt, skip, limit)).all()
     return [article_to_out(item) for item in articles]
 
 
@@ -984,7 +1049,6 @@ def create_knowledge_article(payload: KnowledgeArticleIn, current_user: User = D
     )
     db.add(article)
     db.commit()
-    db.refresh(article)
     return article_to_out(article)
 
 
@@ -1004,7 +1068,6 @@ def update_knowledge_article(
     article.tags = serialize_tags(payload.tags)
     article.updated_at = datetime.now(timezone.utc)
     db.commit()
-    db.refresh(article)
     return article_to_out(article)
 
 
@@ -1019,17 +1082,22 @@ def delete_knowledge_article(article_id: str, current_user: User = Depends(requi
 
 
 @router.get("/api/assets", response_model=list[AssetOut])
-def list_assets(current_user: User = Depends(require_assets_access), db: Session = Depends(get_db)):
-    if current_user.role in (UserRole.admin.value, UserRole.developer.value):
-        items = db.scalars(select(Asset).order_by(Asset.updated_at.desc())).all()
-    else:
-        items = db.scalars(select(Asset).where(Asset.owner_id == current_user.id).order_by(Asset.updated_at.desc())).all()
+def list_assets(
+    skip: int = Query(default=0, ge=0),
+    limit: int | None = Query(default=None, ge=1, le=500),
+    current_user: User = Depends(require_assets_access),
+    db: Session = Depends(get_db),
+):
+    stmt = select(Asset).order_by(Asset.updated_at.desc())
+    if not has_elevated_role(current_user):
+        stmt = stmt.where(Asset.owner_id == current_user.id)
+    items = db.scalars(apply_list_window(stmt, skip, limit)).all()
     return [asset_to_out(item) for item in items]
 
 
 @router.get("/api/assets/{asset_id}/history", response_model=list[AssetEventOut])
 def list_asset_history(asset_id: str, current_user: User = Depends(require_assets_access), db: Session = Depends(get_db)):
-    if current_user.role in (UserRole.admin.value, UserRole.developer.value):
+    if has_elevated_role(current_user):
         item = db.scalar(select(Asset).where(Asset.id == asset_id))
     else:
         item = db.scalar(select(Asset).where(Asset.id == asset_id, Asset.owner_id == current_user.id))
@@ -1041,8 +1109,8 @@ def list_asset_history(asset_id: str, current_user: User = Depends(require_asset
 
 @router.post("/api/assets", response_model=AssetOut)
 def create_asset(payload: AssetIn, current_user: User = Depends(require_assets_access), db: Session = Depends(get_db)):
-    status_value = payload.status.strip().lower()
-    if status_value not in ("active", "maintenance", "retired", "lost"):
+    status_value = payload.status
+    if status_value not in ASSET_STATUS_VALUES:
         raise HTTPException(status_code=400, detail="status must be active|maintenance|retired|lost")
 
     assigned_user = normalize_assigned_user(payload.user)
@@ -1052,21 +1120,21 @@ def create_asset(payload: AssetIn, current_user: User = Depends(require_assets_a
     item = Asset(
         owner_id=current_user.id,
         asset_tag=generated_tag,
-        name=payload.model.strip() or payload.serialNumber.strip().upper() or generated_tag,
+        name=payload.model or payload.serialNumber or generated_tag,
         qr_code=generated_qr,
-        location=payload.location.strip(),
-        serial_number=payload.serialNumber.strip().upper(),
-        category=payload.category.strip(),
-        manufacturer=payload.manufacturer.strip(),
-        model=payload.model.strip(),
-        supplier=payload.supplier.strip(),
+        location=payload.location,
+        serial_number=payload.serialNumber,
+        category=payload.category,
+        manufacturer=payload.manufacturer,
+        model=payload.model,
+        supplier=payload.supplier,
         status=status_value,
         assigned_to=assigned_user,
         purchase_date=None,
         warranty_until=None,
-        notes=payload.notes.strip(),
+        notes=payload.notes,
         user_name=assigned_user,
-        condition=payload.condition.strip(),
+        condition=payload.condition,
     )
     db.add(item)
     db.flush()
@@ -1083,21 +1151,20 @@ def create_asset(payload: AssetIn, current_user: User = Depends(require_assets_a
         },
     )
     db.commit()
-    db.refresh(item)
     return asset_to_out(item)
 
 
 @router.patch("/api/assets/{asset_id}", response_model=AssetOut)
 def update_asset(asset_id: str, payload: AssetIn, current_user: User = Depends(require_assets_access), db: Session = Depends(get_db)):
-    if current_user.role in (UserRole.admin.value, UserRole.developer.value):
+    if has_elevated_role(current_user):
         item = db.scalar(select(Asset).where(Asset.id == asset_id))
     else:
         item = db.scalar(select(Asset).where(Asset.id == asset_id, Asset.owner_id == current_user.id))
     if not item:
         raise HTTPException(status_code=404, detail="Asset not found")
 
-    status_value = payload.status.strip().lower()
-    if status_value not in ("active", "maintenance", "retired", "lost"):
+    status_value = payload.status
+    if status_value not in ASSET_STATUS_VALUES:
         raise HTTPException(status_code=400, detail="status must be active|maintenance|retired|lost")
 
     assigned_user = normalize_assigned_user(payload.user)
@@ -1117,21 +1184,21 @@ def update_asset(asset_id: str, payload: AssetIn, current_user: User = Depends(r
         "notes": item.notes,
     }
 
-    item.name = payload.model.strip() or payload.serialNumber.strip().upper() or item.asset_tag
+    item.name = payload.model or payload.serialNumber or item.asset_tag
     item.qr_code = qr_code_value
-    item.location = payload.location.strip()
-    item.serial_number = payload.serialNumber.strip().upper()
-    item.category = payload.category.strip()
-    item.manufacturer = payload.manufacturer.strip()
-    item.model = payload.model.strip()
-    item.supplier = payload.supplier.strip()
+    item.location = payload.location
+    item.serial_number = payload.serialNumber
+    item.category = payload.category
+    item.manufacturer = payload.manufacturer
+    item.model = payload.model
+    item.supplier = payload.supplier
     item.status = status_value
     item.assigned_to = assigned_user
     item.purchase_date = None
     item.warranty_until = None
-    item.notes = payload.notes.strip()
+    item.notes = payload.notes
     item.user_name = assigned_user
-    item.condition = payload.condition.strip()
+    item.condition = payload.condition
     item.updated_at = datetime.now(timezone.utc)
     current = {
         "qrCode": item.qr_code,
@@ -1160,13 +1227,12 @@ def update_asset(asset_id: str, payload: AssetIn, current_user: User = Depends(r
             {"changes": changes},
         )
     db.commit()
-    db.refresh(item)
     return asset_to_out(item)
 
 
 @router.delete("/api/assets/{asset_id}")
 def delete_asset(asset_id: str, current_user: User = Depends(require_assets_access), db: Session = Depends(get_db)):
-    if current_user.role in (UserRole.admin.value, UserRole.developer.value):
+    if has_elevated_role(current_user):
         item = db.scalar(select(Asset).where(Asset.id == asset_id))
     else:
         item = db.scalar(select(Asset).where(Asset.id == asset_id, Asset.owner_id == current_user.id))
@@ -1209,6 +1275,7 @@ def bulk_delete_assets(payload: BulkIdsIn, current_user: User = Depends(require_
 @router.get("/api/admin/module-access", response_model=list[RoleModuleAccessOut])
 def list_module_access(_: User = Depends(require_admin_access), db: Session = Depends(get_db)):
     output: list[RoleModuleAccessOut] = []
+    now = datetime.now(timezone.utc)
     for role_name in (UserRole.admin.value, UserRole.developer.value, UserRole.user.value):
         current = get_role_module_access_map(db, role_name)
         for module_name in MODULE_NAMES:
@@ -1218,7 +1285,7 @@ def list_module_access(_: User = Depends(require_admin_access), db: Session = De
                     RoleModuleAccess.module == module_name,
                 )
             )
-            updated_at = row.updated_at if row else datetime.now(timezone.utc)
+            updated_at = row.updated_at if row else now
             output.append(
                 RoleModuleAccessOut(
                     role=role_name,
@@ -1264,7 +1331,6 @@ def patch_module_access(
     if normalized_role == current_admin.role and normalized_module == "admin" and not payload.enabled:
         raise HTTPException(status_code=400, detail="Cannot remove your own admin module access")
     db.commit()
-    db.refresh(row)
     write_audit_log(
         db,
         actor=current_admin,
@@ -1450,8 +1516,14 @@ def cleanup_audit_logs(request: Request, current_admin: User = Depends(require_a
 
 
 @router.get("/api/team-events", response_model=list[TeamEventOut])
-def list_team_events(current_user: User = Depends(require_team_personal_access), db: Session = Depends(get_db)):
-    events = db.scalars(select(TeamEvent).where(TeamEvent.owner_id == current_user.id).order_by(TeamEvent.created_at.desc())).all()
+def list_team_events(
+    skip: int = Query(default=0, ge=0),
+    limit: int | None = Query(default=None, ge=1, le=500),
+    current_user: User = Depends(require_team_personal_access),
+    db: Session = Depends(get_db),
+):
+    stmt = select(TeamEvent).where(TeamEvent.owner_id == current_user.id).order_by(TeamEvent.created_at.desc())
+    events = db.scalars(apply_list_window(stmt, skip, limit)).all()
     return [team_event_to_out(item) for item in events]
 
 
@@ -1467,7 +1539,6 @@ def create_team_event(payload: TeamEventIn, current_user: User = Depends(require
     )
     db.add(event)
     db.commit()
-    db.refresh(event)
     return team_event_to_out(event)
 
 
@@ -1484,21 +1555,64 @@ def delete_team_event(event_id: str, current_user: User = Depends(require_team_p
 @router.delete("/api/team-events")
 def delete_team_events_by_date(eventDate: str, current_user: User = Depends(require_team_personal_access), db: Session = Depends(get_db)):
     target_date = parse_date(eventDate)
-    events = db.scalars(select(TeamEvent).where(TeamEvent.owner_id == current_user.id, TeamEvent.event_date == target_date)).all()
-    for item in events:
-        db.delete(item)
+    db.execute(delete(TeamEvent).where(TeamEvent.owner_id == current_user.id, TeamEvent.event_date == target_date))
     db.commit()
     return {"ok": True}
 
 
+def _resolve_assignee_id(db: Session, assignee_id: str) -> str:
+    """Validate an assignee id without loading the whole user row."""
+    row = db.execute(select(User.id, User.role).where(User.id == assignee_id)).first()
+    if not row:
+        raise HTTPException(status_code=404, detail="Assignee not found")
+    if row.role not in ELEVATED_ROLES:
+        raise HTTPException(status_code=400, detail="Assignee must be admin or developer")
+    return row.id
+
+
+# Ticket lists serialize requester/assignee/fixed_by emails and the evidence
+# rows; eager-load them in one batch instead of issuing per-ticket lookups.
+_TICKET_USER_LOADS = (
+    selectinload(Ticket.requester),
+    selectinload(Ticket.fixed_by),
+    selectinload(Ticket.assignee),
+    selectinload(Ticket.evidence),
+)
+
+# Statements for the hottest ticket lists are built once at import time;
+# per request we only bind parameters and apply the optional window.
+_MY_TICKETS_STMT = (
+    select(Ticket)
+    .options(*_TICKET_USER_LOADS)
+    .where(Ticket.requester_id == bindparam("requester_id"))
+    .order_by(Ticket.created_at.desc())
+)
+_OPEN_TICKETS_STMT = (
+    select(Ticket)
+    .options(*_TICKET_USER_LOADS)
+    .where(Ticket.status.in_(TICKET_ACTIVE_STATUSES))
+    .order_by(Ticket.created_at.asc())
+)
+
+_DATA_IMAGE_PREFIX = "data:image/"
+
+
+def _new_uuid_batch(count: int) -> list[str]:
+    # One urandom read covers the whole batch instead of a syscall per id.
+    raw = os.urandom(16 * count)
+    return [str(uuid.UUID(bytes=raw[i * 16 : (i + 1) * 16], version=4)) for i in range(count)]
+
+
 @router.get("/api/tickets/mine", response_model=list[TicketOut])
-def list_my_tickets(current_user: User = Depends(require_tickets_access), db: Session = Depends(get_db)):
-    tickets = db.scalars(
-        select(Ticket)
-        .where(Ticket.requester_id == current_user.id)
-        .order_by(Ticket.created_at.desc())
-    ).all()
-    return [ticket_to_out(item, db) for item in tickets]
+def list_my_tickets(
+    skip: int = Query(default=0, ge=0),
+    limit: int | None = Query(default=None, ge=1, le=500),
+    current_user: User = Depends(require_tickets_access),
+    db: Session = Depends(get_db),
+):
+    stmt = apply_list_window(_MY_TICKETS_STMT, skip, limit)
+    tickets = db.scalars(stmt, {"requester_id": current_user.id}).all()
+    return [ticket_to_out(item) for item in tickets]
 
 
 @router.get("/api/tickets/mine/{ticket_id}", response_model=TicketOut)
@@ -1506,17 +1620,23 @@ def get_my_ticket(ticket_id: str, current_user: User = Depends(require_tickets_a
     ticket = db.scalar(select(Ticket).where(Ticket.id == ticket_id, Ticket.requester_id == current_user.id))
     if not ticket:
         raise HTTPException(status_code=404, detail="Ticket not found")
-    return ticket_to_out(ticket, db)
+    return ticket_to_out(ticket)
 
 
 @router.get("/api/tickets/mine/{ticket_id}/events", response_model=list[TicketEventOut])
 def list_my_ticket_events(ticket_id: str, current_user: User = Depends(require_tickets_access), db: Session = Depends(get_db)):
-    ticket = db.scalar(select(Ticket).where(Ticket.id == ticket_id, Ticket.requester_id == current_user.id))
-    if not ticket:
-        raise HTTPException(status_code=404, detail="Ticket not found")
     events = db.scalars(
-        select(TicketEvent).where(TicketEvent.ticket_id == ticket_id).order_by(TicketEvent.created_at.asc())
+        select(TicketEvent)
+        .join(Ticket, Ticket.id == TicketEvent.ticket_id)
+        .where(Ticket.id == ticket_id, Ticket.requester_id == current_user.id)
+        .order_by(TicketEvent.created_at.asc())
     ).all()
+    if not events:
+        # No rows can mean either a foreign ticket or one with no events yet;
+        # only the cold path pays for the extra ownership probe.
+        owns_ticket = db.scalar(select(Ticket.id).where(Ticket.id == ticket_id, Ticket.requester_id == current_user.id))
+        if not owns_ticket:
+            raise HTTPException(status_code=404, detail="Ticket not found")
     return [ticket_event_to_out(item, db) for item in events]
 
 
@@ -1525,9 +1645,8 @@ def delete_my_ticket(ticket_id: str, current_user: User = Depends(require_ticket
     ticket = db.scalar(select(Ticket).where(Ticket.id == ticket_id, Ticket.requester_id == current_user.id))
     if not ticket:
         raise HTTPException(status_code=404, detail="Ticket not found")
-    events = db.scalars(select(TicketEvent).where(TicketEvent.ticket_id == ticket_id)).all()
-    for event in events:
-        db.delete(event)
+    db.execute(delete(TicketEvent).where(TicketEvent.ticket_id == ticket_id))
+    db.execute(delete(TicketEvidence).where(TicketEvidence.ticket_id == ticket_id))
     db.delete(ticket)
     db.commit()
     return {"ok": True}
@@ -1542,9 +1661,8 @@ def bulk_delete_my_tickets(payload: BulkIdsIn, current_user: User = Depends(requ
     tickets = db.scalars(select(Ticket).where(Ticket.id.in_(unique_ids), Ticket.requester_id == current_user.id)).all()
     ticket_ids = [ticket.id for ticket in tickets]
     if ticket_ids:
-        events = db.scalars(select(TicketEvent).where(TicketEvent.ticket_id.in_(ticket_ids))).all()
-        for event in events:
-            db.delete(event)
+        db.execute(delete(TicketEvent).where(TicketEvent.ticket_id.in_(ticket_ids)))
+        db.execute(delete(TicketEvidence).where(TicketEvidence.ticket_id.in_(ticket_ids)))
     for ticket in tickets:
         db.delete(ticket)
     db.commit()
@@ -1570,7 +1688,6 @@ def create_ticket(payload: TicketIn, current_user: User = Depends(require_ticket
         resolution_due_at=resolution_due,
     )
     db.add(ticket)
-    db.flush()
     log_ticket_event(
         db,
         ticket,
@@ -1579,38 +1696,40 @@ def create_ticket(payload: TicketIn, current_user: User = Depends(require_ticket
         {"status": ticket.status, "priority": priority, "category": category},
     )
     db.commit()
-    db.refresh(ticket)
-    return ticket_to_out(ticket, db)
+    return ticket_to_out(ticket)
 
 
 @router.get("/api/tickets/open", response_model=list[TicketOut])
-def list_open_tickets(_: User = Depends(require_team_tickets_access), db: Session = Depends(get_db)):
-    tickets = db.scalars(
-        select(Ticket)
-        .where(Ticket.status.in_(TICKET_ACTIVE_STATUSES))
-        .order_by(Ticket.created_at.asc())
-    ).all()
-    return [ticket_to_out(item, db) for item in tickets]
+def list_open_tickets(
+    skip: int = Query(default=0, ge=0),
+    limit: int | None = Query(default=None, ge=1, le=500),
+    _: User = Depends(require_team_tickets_access),
+    db: Session = Depends(get_db),
+):
+    tickets = db.scalars(apply_list_window(_OPEN_TICKETS_STMT, skip, limit)).all()
+    return [ticket_to_out(item) for item in tickets]
 
 
 @router.get("/api/tickets/open-unassigned", response_model=list[TicketOut])
 def list_open_unassigned_tickets(_: User = Depends(require_team_tickets_access), db: Session = Depends(get_db)):
     tickets = db.scalars(
         select(Ticket)
+        .options(*_TICKET_USER_LOADS)
         .where(Ticket.status.in_(TICKET_ACTIVE_STATUSES), Ticket.assignee_id.is_(None))
         .order_by(Ticket.created_at.asc())
     ).all()
-    return [ticket_to_out(item, db) for item in tickets]
+    return [ticket_to_out(item) for item in tickets]
 
 
 @router.get("/api/tickets/assigned-mine", response_model=list[TicketOut])
 def list_assigned_my_tickets(current_user: User = Depends(require_team_tickets_access), db: Session = Depends(get_db)):
     tickets = db.scalars(
         select(Ticket)
+        .options(*_TICKET_USER_LOADS)
         .where(Ticket.assignee_id == current_user.id)
         .order_by(Ticket.updated_at.desc())
     ).all()
-    return [ticket_to_out(item, db) for item in tickets]
+    return [ticket_to_out(item) for item in tickets]
 
 
 @router.get("/api/tickets/assignable-users", response_model=list[TicketAssigneeOut])
@@ -1618,7 +1737,7 @@ def list_ticket_assignable_users(current_user: User = Depends(require_team_ticke
     if current_user.role == UserRole.admin.value:
         items = db.scalars(
             select(User)
-            .where(User.role.in_([UserRole.admin.value, UserRole.developer.value]))
+            .where(User.role.in_(ELEVATED_ROLES))
             .order_by(User.email.asc())
         ).all()
     else:
@@ -1628,19 +1747,20 @@ def list_ticket_assignable_users(current_user: User = Depends(require_team_ticke
 
 @router.get("/api/tickets/{ticket_id}", response_model=TicketOut)
 def get_ticket(ticket_id: str, _: User = Depends(require_team_tickets_access), db: Session = Depends(get_db)):
-    ticket = db.get(Ticket, ticket_id)
+    ticket = get_by_uuid(db, Ticket, ticket_id)
     if not ticket:
         raise HTTPException(status_code=404, detail="Ticket not found")
 
-    return ticket_to_out(ticket, db)
+    return ticket_to_out(ticket)
 
 
 @router.patch("/api/tickets/{ticket_id}", response_model=TicketOut)
 def patch_ticket(ticket_id: str, payload: TicketPatchIn, current_user: User = Depends(require_team_tickets_access), db: Session = Depends(get_db)):
-    ticket = db.get(Ticket, ticket_id)
+    ticket = get_by_uuid(db, Ticket, ticket_id)
     if not ticket:
         raise HTTPException(status_code=404, detail="Ticket not found")
 
+    now = datetime.now(timezone.utc)
     next_status = normalize_ticket_status(payload.status) if payload.status is not None else ticket.status
     validate_ticket_transition(ticket.status, next_status)
     previous_status = ticket.status
@@ -1652,31 +1772,50 @@ def patch_ticket(ticket_id: str, payload: TicketPatchIn, current_user: User = De
         if payload.assigneeId == "":
             ticket.assignee_id = None
         else:
-            assignee = db.get(User, payload.assigneeId)
-            if not assignee:
-                raise HTTPException(status_code=404, detail="Assignee not found")
-            if assignee.role not in (UserRole.admin.value, UserRole.developer.value):
-                raise HTTPException(status_code=400, detail="Assignee must be admin or developer")
-            ticket.assignee_id = assignee.id
+            ticket.assignee_id = _resolve_assignee_id(db, payload.assigneeId)
     if payload.processNotes is not None:
         ticket.process_notes = payload.processNotes
     if payload.evidence is not None:
-        normalized_evidence: list[dict[str, str | None]] = []
+        existing_evidence = {row.id: row for row in ticket.evidence}
+        seen_evidence_ids: set[str] = set()
+        # The frontend falls back to non-UUID local ids in non-secure
+        # contexts; treat those like blank ids and mint real ones, so they
+        # never reach the uuid primary key.
+        missing_ids = sum(1 for item in payload.evidence if not is_uuid_text(item.id.strip()))
+        fresh_ids = iter(_new_uuid_batch(missing_ids)) if missing_ids else iter(())
         for item in payload.evidence:
             image_data = item.imageData.strip() if item.imageData else None
-            if image_data and not image_data.startswith("data:image/"):
+            if image_data and not image_data.startswith(_DATA_IMAGE_PREFIX):
                 raise HTTPException(status_code=400, detail="evidence imageData must be a data:image/* URL")
-            normalized_evidence.append(
-                {
-                    "id": item.id.strip() or str(uuid.uuid4()),
-                    "text": item.text.strip(),
-                    "imageData": image_data,
-                    "imageName": item.imageName.strip() if item.imageName else None,
-                    "createdAt": item.createdAt or to_iso(datetime.now(timezone.utc)),
-                }
-            )
-        ticket.evidence_json = json.dumps(normalized_evidence)
-    now = datetime.now(timezone.utc)
+            item_id = item.id.strip()
+            if not is_uuid_text(item_id):
+                item_id = next(fresh_ids)
+            item_text = item.text.strip()
+            image_name = item.imageName.strip() if item.imageName else None
+            seen_evidence_ids.add(item_id)
+            row = existing_evidence.get(item_id)
+            if row is None:
+                ticket.evidence.append(
+                    TicketEvidence(
+                        id=item_id,
+                        text=item_text,
+                        image_data=image_data,
+                        image_name=image_name,
+                        created_at=parse_iso_datetime_or_now(item.createdAt) if item.createdAt else now,
+                    )
+                )
+                continue
+            # Only dirty the columns that actually changed so unchanged
+            # image blobs are never rewritten.
+            if row.text != item_text:
+                row.text = item_text
+            if row.image_data != image_data:
+                row.image_data = image_data
+            if row.image_name != image_name:
+                row.image_name = image_name
+        for row_id, row in existing_evidence.items():
+            if row_id not in seen_evidence_ids:
+                ticket.evidence.remove(row)
     if ticket.status in ("in_progress", "triaged") and ticket.first_responded_at is None:
         ticket.first_responded_at = now
     if ticket.status == "resolved":
@@ -1687,7 +1826,7 @@ def patch_ticket(ticket_id: str, payload: TicketPatchIn, current_user: User = De
     if ticket.status == "reopened":
         ticket.resolved_at = None
         ticket.closed_at = None
-    ticket.updated_at = datetime.now(timezone.utc)
+    ticket.updated_at = now
     ticket.fixed_by_id = current_user.id if ticket.status in ("in_progress", "resolved", "closed") else None
     log_ticket_event(
         db,
@@ -1701,35 +1840,28 @@ def patch_ticket(ticket_id: str, payload: TicketPatchIn, current_user: User = De
         },
     )
     db.commit()
-    db.refresh(ticket)
-    return ticket_to_out(ticket, db)
+    return ticket_to_out(ticket)
 
 
 @router.patch("/api/tickets/{ticket_id}/assign", response_model=TicketOut)
 def assign_ticket(ticket_id: str, payload: TicketAssignIn, current_user: User = Depends(require_team_tickets_access), db: Session = Depends(get_db)):
-    ticket = db.get(Ticket, ticket_id)
+    ticket = get_by_uuid(db, Ticket, ticket_id)
     if not ticket:
         raise HTTPException(status_code=404, detail="Ticket not found")
     validate_assignment_permission(current_user, payload.assigneeId)
     if payload.assigneeId is None:
         ticket.assignee_id = None
     else:
-        assignee = db.get(User, payload.assigneeId)
-        if not assignee:
-            raise HTTPException(status_code=404, detail="Assignee not found")
-        if assignee.role not in (UserRole.admin.value, UserRole.developer.value):
-            raise HTTPException(status_code=400, detail="Assignee must be admin or developer")
-        ticket.assignee_id = assignee.id
+        ticket.assignee_id = _resolve_assignee_id(db, payload.assigneeId)
     ticket.updated_at = datetime.now(timezone.utc)
     log_ticket_event(db, ticket, current_user.id, "assigned", {"assigneeId": ticket.assignee_id})
     db.commit()
-    db.refresh(ticket)
-    return ticket_to_out(ticket, db)
+    return ticket_to_out(ticket)
 
 
 @router.get("/api/tickets/{ticket_id}/events", response_model=list[TicketEventOut])
 def list_ticket_events(ticket_id: str, _: User = Depends(require_team_tickets_access), db: Session = Depends(get_db)):
-    ticket = db.get(Ticket, ticket_id)
+    ticket = get_by_uuid(db, Ticket, ticket_id)
     if not ticket:
         raise HTTPException(status_code=404, detail="Ticket not found")
     events = db.scalars(
@@ -1739,13 +1871,16 @@ def list_ticket_events(ticket_id: str, _: User = Depends(require_team_tickets_ac
 
 
 @router.get("/api/maintenance-records", response_model=list[MaintenanceRecordOut])
-def list_maintenance_records(current_user: User = Depends(require_team_work_access), db: Session = Depends(get_db)):
-    if current_user.role in (UserRole.admin.value, UserRole.developer.value):
-        records = db.scalars(select(MaintenanceRecord).order_by(MaintenanceRecord.created_at.desc())).all()
-    else:
-        records = db.scalars(
-            select(MaintenanceRecord).where(MaintenanceRecord.owner_id == current_user.id).order_by(MaintenanceRecord.created_at.desc())
-        ).all()
+def list_maintenance_records(
+    skip: int = Query(default=0, ge=0),
+    limit: int | None = Query(default=None, ge=1, le=500),
+    current_user: User = Depends(require_team_work_access),
+    db: Session = Depends(get_db),
+):
+    stmt = select(MaintenanceRecord).order_by(MaintenanceRecord.created_at.desc())
+    if not has_elevated_role(current_user):
+        stmt = stmt.where(MaintenanceRecord.owner_id == current_user.id)
+    records = db.scalars(apply_list_window(stmt, skip, limit)).all()
     return [maintenance_to_out(item) for item in records]
 
 
@@ -1768,19 +1903,24 @@ def create_maintenance_record(payload: MaintenanceRecordIn, current_user: User =
         location=payload.location.upper(),
         responsible_name=username_from_email(current_user.email),
     )
-    for item in payload.checks:
-        record.checks.append(
-            MaintenanceCheck(
-                id=item.id,
-                label=item.label,
-                category=item.category,
-                checked=item.checked,
-                observation=item.observation.upper(),
-            )
-        )
-
     db.add(record)
     db.flush()
+    if payload.checks:
+        # One multi-row INSERT instead of per-check ORM instances.
+        db.execute(
+            insert(MaintenanceCheck),
+            [
+                {
+                    "id": item.id,
+                    "record_id": record.id,
+                    "label": item.label,
+                    "category": item.category,
+                    "checked": item.checked,
+                    "observation": item.observation.upper(),
+                }
+                for item in payload.checks
+            ],
+        )
     matched_asset = db.scalar(select(Asset).where(Asset.qr_code == record.qr))
     if not matched_asset:
         matched_asset = db.scalar(select(Asset).where(Asset.serial_number == record.serial_number))
@@ -1798,13 +1938,12 @@ def create_maintenance_record(payload: MaintenanceRecordIn, current_user: User =
             },
         )
     db.commit()
-    db.refresh(record)
     return maintenance_to_out(record)
 
 
 @router.delete("/api/maintenance-records/{record_id}")
 def delete_maintenance_record(record_id: str, current_user: User = Depends(require_team_work_access), db: Session = Depends(get_db)):
-    if current_user.role in (UserRole.admin.value, UserRole.developer.value):
+    if has_elevated_role(current_user):
         record = db.scalar(select(MaintenanceRecord).where(MaintenanceRecord.id == record_id))
     else:
         record = db.scalar(select(MaintenanceRecord).where(MaintenanceRecord.id == record_id, MaintenanceRecord.owner_id == current_user.id))
@@ -1815,44 +1954,118 @@ def delete_maintenance_record(record_id: str, current_user: User = Depends(requi
     return {"ok": True}
 
 
+# Template coordinates per check as (row, reviewed_col, observation_col).
+# Reviewed marks live in column N (14) and observations in column Q (17).
 CHECK_CELL_MAP = {
-    "hardware-general-cleaning": ("N12", "Q12"),
-    "hardware-internal-components-cleaning": ("N13", "Q13"),
-    "hardware-peripherals-validation": ("N14", "Q14"),
-    "hardware-power-system-validation": ("N15", "Q15"),
-    "hardware-network-card-validation": ("N16", "Q16"),
-    "software-os-diagnosis-correction": ("N19", "Q19"),
-    "software-os-driver-updates": ("N20", "Q20"),
-    "software-system-files-cleanup": ("N21", "Q21"),
-    "software-disk-optimization": ("N22", "Q22"),
-    "software-antivirus-check": ("N23", "Q23"),
-    "software-virus-definitions-update": ("N24", "Q24"),
-    "software-service-pack-installation": ("N25", "Q25"),
-    "software-ram-optimization": ("N26", "Q26"),
-    "software-disk-capacity-optimization": ("N27", "Q27"),
-    "software-authorized-software-policies": ("N28", "Q28"),
+    "hardware-general-cleaning": (12, 14, 17),
+    "hardware-internal-components-cleaning": (13, 14, 17),
+    "hardware-peripherals-validation": (14, 14, 17),
+    "hardware-power-system-validation": (15, 14, 17),
+    "hardware-network-card-validation": (16, 14, 17),
+    "software-os-diagnosis-correction": (19, 14, 17),
+    "software-os-driver-updates": (20, 14, 17),
+    "software-system-files-cleanup": (21, 14, 17),
+    "software-disk-optimization": (22, 14, 17),
+    "software-antivirus-check": (23, 14, 17),
+    "software-virus-definitions-update": (24, 14, 17),
+    "software-service-pack-installation": (25, 14, 17),
+    "software-ram-optimization": (26, 14, 17),
+    "software-disk-capacity-optimization": (27, 14, 17),
+    "software-authorized-software-policies": (28, 14, 17),
 }
 
 
+# Keep alphanumerics and hyphens (underscore is not alphanumeric), drop the rest.
+_SANITIZE_RE = re.compile(r"[^\w-]+|_+")
+_DIGITS_RE = re.compile(r"\d+")
+
+
 def _normalize_upper(value: str) -> str:
     return (value or "").strip().upper()
 
 
 def _sanitize_token(value: str) -> str:
-    source = _normalize_upper(value)
-    return "".join(ch for ch in source if ch.isalnum() or ch == "-")
+    return _SANITIZE_RE.sub("", _normalize_upper(value))
 
 
 def _normalize_consecutive_4(value: str) -> str:
     source = _normalize_upper(value)
     if source.startswith("TDC-"):
         source = source[4:]
-    digits = "".join(ch for ch in source if ch.isdigit())
+    digits = "".join(_DIGITS_RE.findall(source))
     if not digits:
         return "0000"
     return digits.zfill(4)[-4:]
 
 
+def _render_workbook(
+    template_bytes: bytes,
+    keep_vba: bool,
+    brand: str,
+    qr: str,
+    model: str,
+    serial_number: str,
+    user_name: str,
+    date_value: datetime,
+    responsible_name: str,
+    location: str,
+    checks: list,
+) -> tempfile.SpooledTemporaryFile:
+    try:
+        # keep_links/rich_text off: the template has no external links and the
+        # export only writes plain values, so skip parsing either part.
+        workbook = load_workbook(io.BytesIO(template_bytes), keep_vba=keep_vba, keep_links=False, rich_text=False)
+    except Exception as exc:  # noqa: BLE001
+        raise HTTPException(status_code=400, detail="Could not open template workbook") from exc
+
+    sheet = workbook[workbook.sheetnames[0]]
+    # Integer coordinates skip openpyxl's string-coordinate parsing.
+    sheet.cell(row=3, column=12, value=brand)  # L3
+    sheet.cell(row=5, column=4, value=qr)  # D5
+    sheet.cell(row=6, column=4, value=model)  # D6
+    sheet.cell(row=6, column=19, value=serial_number)  # S6
+    sheet.cell(row=7, column=4, value=user_name)  # D7
+    sheet.cell(row=7, column=19, value=date_value)  # S7
+    sheet.cell(row=8, column=10, value=responsible_name)  # J8
+    sheet.cell(row=8, column=19, value=location)  # S8
+
+    for row, reviewed_col, observation_col in CHECK_CELL_MAP.values():
+        sheet.cell(row=row, column=reviewed_col, value="")
+        sheet.cell(row=row, column=observation_col, value="")
+
+    for item in checks:
+        mapping = CHECK_CELL_MAP.get(item.get("id"))
+        if not mapping:
+            continue
+        row, reviewed_col, observation_col = mapping
+        if bool(item.get("checked")):
+            sheet.cell(row=row, column=reviewed_col, value="X")
+        observation = _normalize_upper(str(item.get("observation", "")))
+        if observation:
+            sheet.cell(row=row, column=observation_col, value=observation)
+
+    # Spool to disk past 4 MiB so concurrent exports of large macro-enabled
+    # templates do not each hold the full workbook in memory.
+    output = tempfile.SpooledTemporaryFile(max_size=4 * 1024 * 1024)
+    # workbook.save hardcodes zlib level 6; level 1 costs a slightly larger
+    # file but cuts the compression CPU for this internal download.
+    archive = zipfile.ZipFile(output, "w", zipfile.ZIP_DEFLATED, allowZip64=True, compresslevel=1)
+    ExcelWriter(workbook, archive).save()
+    output.seek(0)
+    return output
+
+
+def _iter_file_chunks(handle, chunk_size: int = 64 * 1024):
+    try:
+        while True:
+            chunk = handle.read(chunk_size)
+            if not chunk:
+                break
+            yield chunk
+    finally:
+        handle.close()
+
+
 @router.post("/api/maintenance/export")
 async def export_maintenance(
     template: UploadFile = File(...),
@@ -1868,8 +2081,8 @@ async def export_maintenance(
         raise HTTPException(status_code=400, detail="Template must be an .xlsx or .xlsm file")
 
     try:
-        record = json.loads(payload)
-    except json.JSONDecodeError as exc:
+        record = orjson.loads(payload)
+    except orjson.JSONDecodeError as exc:
         raise HTTPException(status_code=400, detail="Invalid payload JSON") from exc
 
     required_fields = [
@@ -1918,41 +2131,23 @@ async def export_maintenance(
         raise HTTPException(status_code=400, detail="maintenanceDate must be YYYY-MM-DD") from exc
 
     template_bytes = await template.read()
-    try:
-        workbook = load_workbook(io.BytesIO(template_bytes), keep_vba=lower_name.endswith(".xlsm"))
-    except Exception as exc:  # noqa: BLE001
-        raise HTTPException(status_code=400, detail="Could not open template workbook") from exc
-
-    sheet = workbook[workbook.sheetnames[0]]
-    sheet["L3"] = brand
-    sheet["D5"] = qr
-    sheet["D6"] = model
-    sheet["S6"] = serial_number
-    sheet["D7"] = user_name
-    sheet["S7"] = date_value
-    sheet["J8"] = responsible_name
-    sheet["S8"] = location
-
-    for reviewed_cell, observation_cell in CHECK_CELL_MAP.values():
-        sheet[reviewed_cell] = ""
-        sheet[observation_cell] = ""
-
     checks = record["checks"] if isinstance(record["checks"], list) else []
-    for item in checks:
-        check_id = item.get("id")
-        mapping = CHECK_CELL_MAP.get(check_id)
-        if not mapping:
-            continue
-        reviewed_cell, observation_cell = mapping
-        if bool(item.get("checked")):
-            sheet[reviewed_cell] = "X"
-        observation = _normalize_upper(str(item.get("observation", "")))
-        if observation:
-            sheet[observation_cell] = observation
-
-    output = io.BytesIO()
-    workbook.save(output)
-    output.seek(0)
+    # The workbook render is CPU-bound; run it in the threadpool so the
+    # event loop stays responsive while the Excel file is produced.
+    output = await run_in_threadpool(
+        _render_workbook,
+        template_bytes,
+        lower_name.endswith(".xlsm"),
+        brand,
+        qr,
+        model,
+        serial_number,
+        user_name,
+        date_value,
+        responsible_name,
+        location,
+        checks,
+    )
 
     file_brand = _sanitize_token(brand) or "NA"
     file_model = _sanitize_token(model) or "NA"
@@ -1970,7 +2165,7 @@ async def export_maintenance(
     )
 
     return StreamingResponse(
-        output,
+        _iter_file_chunks(output),
         media_type=media_type,
         headers={"Content-Disposition": content_disposition},
     )
@@ -1,18 +1,20 @@
 import os
 import secrets
 import hashlib
+import threading
+import time
 from datetime import datetime, timedelta, timezone
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
-from jose import JWTError, jwt
+import jwt
 from passlib.context import CryptContext
 from sqlalchemy.orm import Session
 
 try:
-    from .models import SessionLocal, User
+    from .models import SessionLocal, User, is_uuid_text
 except ImportError:
-    from models import SessionLocal, User
+    from models import SessionLocal, User, is_uuid_text
 
 
 APP_ENV = os.getenv("APP_ENV", "development").strip().lower()
@@ -28,7 +30,17 @@ if len(JWT_SECRET) < 32:
 JWT_ALGORITHM = "HS256"
 JWT_EXP_MINUTES = int(os.getenv("JWT_EXP_MINUTES", "720"))
 
-pwd_context = CryptContext(schemes=["pbkdf2_sha256"], deprecated="auto")
+# Argon2id (argon2-cffi, reference C implementation) is the primary hash;
+# pbkdf2_sha256 stays registered so existing rows keep verifying, and login
+# transparently rehashes them via verify_and_update_password.
+ARGON2_MEMORY_COST = int(os.getenv("ARGON2_MEMORY_COST", "65536"))
+pwd_context = CryptContext(
+    schemes=["argon2", "pbkdf2_sha256"],
+    deprecated=["pbkdf2_sha256"],
+    argon2__time_cost=2,
+    argon2__memory_cost=ARGON2_MEMORY_COST,
+    argon2__parallelism=1,
+)
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/login")
 
 
@@ -48,6 +60,11 @@ def verify_password(plain: str, hashed: str) -> bool:
     return pwd_context.verify(plain, hashed)
 
 
+def verify_and_update_password(plain: str, hashed: str) -> tuple[bool, str | None]:
+    # Returns a replacement hash when the stored one uses a deprecated scheme.
+    return pwd_context.verify_and_update(plain, hashed)
+
+
 def create_access_token(user: User) -> str:
     expire = datetime.now(timezone.utc) + timedelta(minutes=JWT_EXP_MINUTES)
     payload = {"sub": user.id, "email": user.email, "role": user.role, "exp": expire}
@@ -62,17 +79,47 @@ def hash_activation_token(token: str) -> str:
     return hashlib.sha256(token.encode("utf-8")).hexdigest()
 
 
-def get_current_user(
-    token: str = Depends(oauth2_scheme),
-    db: Session = Depends(get_db),
-) -> User:
+# Successful signature checks are cached briefly (keyed by a token digest)
+# so request bursts from the same client skip the HMAC verification. The
+# user row is still fetched per request, so role changes and deletions take
+# effect immediately; entries never outlive the token's own expiry.
+TOKEN_CACHE_TTL_SECONDS = int(os.getenv("TOKEN_CACHE_TTL_SECONDS", "30"))
+_TOKEN_CACHE_MAX = 10000
+_token_cache: dict[str, tuple[float, str]] = {}
+_token_cache_lock = threading.Lock()
+
+
+def _verify_token_subject(token: str) -> str:
+    key = hashlib.blake2b(token.encode("utf-8"), digest_size=16).hexdigest()
+    now = time.time()
+    with _token_cache_lock:
+        entry = _token_cache.get(key)
+        if entry and entry[0] > now:
+            return entry[1]
     try:
         payload = jwt.decode(token, JWT_SECRET, algorithms=[JWT_ALGORITHM])
         user_id = str(payload.get("sub"))
-    except JWTError as exc:
+    except jwt.PyJWTError as exc:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token") from exc
+    expires_at = now + TOKEN_CACHE_TTL_SECONDS
+    token_exp = payload.get("exp")
+    if isinstance(token_exp, (int, float)):
+        expires_at = min(expires_at, float(token_exp))
+    with _token_cache_lock:
+        if len(_token_cache) >= _TOKEN_CACHE_MAX:
+            _token_cache.clear()
+        _token_cache[key] = (expires_at, user_id)
+    return user_id
+
 
-    user = db.get(User, user_id)
+def get_current_user(
+    token: str = Depends(oauth2_scheme),
+    db: Session = Depends(get_db),
+) -> User:
+    user_id = _verify_token_subject(token)
+    # Tokens minted before the uuid migration could carry a legacy subject;
+    # anything that is not a uuid cannot match a user anymore.
+    user = db.get(User, user_id) if is_uuid_text(user_id) else None
     if not user:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid user")
     return user
@@ -1,16 +1,22 @@
 import logging
-import json
 import re
+import threading
 import uuid
 from datetime import date, datetime, timedelta, timezone
+from functools import lru_cache
 
+import orjson
 from fastapi import Depends, HTTPException, Request
-from sqlalchemy import select
+from sqlalchemy import Integer, func, select
 from sqlalchemy.orm import Session
 
 try:
     from .auth import get_current_user, get_db
     from .models import (
+        ASSET_STATUS_VALUES,
+        TICKET_CATEGORY_VALUES,
+        TICKET_PRIORITY_VALUES,
+        TICKET_STATUS_VALUES,
         Asset,
         AssetEvent,
         AuditLog,
@@ -27,6 +33,7 @@ try:
         User,
         RoleModuleAccess,
         UserRole,
+        is_uuid_text,
     )
     from .schemas import (
         AssetEventOut,
@@ -47,6 +54,10 @@ try:
 except ImportError:
     from auth import get_current_user, get_db
     from models import (
+        ASSET_STATUS_VALUES,
+        TICKET_CATEGORY_VALUES,
+        TICKET_PRIORITY_VALUES,
+        TICKET_STATUS_VALUES,
         Asset,
         AssetEvent,
         AuditLog,
@@ -63,6 +74,7 @@ except ImportError:
         User,
         RoleModuleAccess,
         UserRole,
+        is_uuid_text,
     )
     from schemas import (
         AssetEventOut,
@@ -115,9 +127,13 @@ DEFAULT_ROLE_MODULE_ACCESS: dict[str, dict[str, bool]] = {
 
 
 def parse_date(value: str) -> date:
+    # The format is fixed, so parse the slices directly instead of paying
+    # for strptime's format-string machinery on every create.
     try:
-        return datetime.strptime(value, "%Y-%m-%d").date()
-    except ValueError as exc:
+        if len(value) != 10 or value[4] != "-" or value[7] != "-":
+            raise ValueError(value)
+        return date(int(value[0:4]), int(value[5:7]), int(value[8:10]))
+    except (TypeError, ValueError) as exc:
         raise HTTPException(status_code=400, detail="Date must be YYYY-MM-DD") from exc
 
 
@@ -130,13 +146,7 @@ def parse_optional_date(value: str | None) -> date | None:
     return parse_date(raw)
 
 
-def parse_tags(raw: str) -> list[str]:
-    if not raw.strip():
-        return []
-    return [item for item in (segment.strip() for segment in raw.split(",")) if item]
-
-
-def serialize_tags(items: list[str]) -> str:
+def serialize_tags(items: list[str]) -> list[str]:
     normalized: list[str] = []
     seen: set[str] = set()
     for item in items:
@@ -148,7 +158,7 @@ def serialize_tags(items: list[str]) -> str:
             continue
         seen.add(lowered)
         normalized.append(value)
-    return ",".join(normalized)
+    return normalized
 
 
 DEPARTMENT_OPTIONS: tuple[str, ...] = (
@@ -170,16 +180,6 @@ DEPARTMENT_OPTIONS: tuple[str, ...] = (
     "Past Employee",
 )
 
-TICKET_STATUS_VALUES: tuple[str, ...] = (
-    "new",
-    "triaged",
-    "in_progress",
-    "waiting_user",
-    "blocked",
-    "resolved",
-    "closed",
-    "reopened",
-)
 TICKET_ACTIVE_STATUSES: tuple[str, ...] = ("new", "triaged", "in_progress", "waiting_user", "blocked", "reopened")
 TICKET_RESOLUTION_STATUSES: tuple[str, ...] = ("resolved", "closed")
 TICKET_TRANSITIONS: dict[str, set[str]] = {
@@ -192,38 +192,42 @@ TICKET_TRANSITIONS: dict[str, set[str]] = {
     "closed": {"reopened"},
     "reopened": {"triaged", "in_progress", "waiting_user", "blocked", "resolved"},
 }
-TICKET_PRIORITY_VALUES: tuple[str, ...] = ("low", "medium", "high", "critical")
-TICKET_CATEGORY_VALUES: tuple[str, ...] = ("printer", "help", "network", "software", "hardware", "access")
 TICKET_FIRST_RESPONSE_SLA_HOURS: dict[str, int] = {"low": 24, "medium": 8, "high": 2, "critical": 1}
 TICKET_RESOLUTION_SLA_HOURS: dict[str, int] = {"low": 72, "medium": 24, "high": 8, "critical": 4}
 
 
+_DEPT_LOOKUP: dict[str, str] = {option.casefold(): option for option in DEPARTMENT_OPTIONS}
+
+
+# The normalize_* validators below are pure functions over a handful of
+# distinct inputs per deployment, so a small lru_cache turns repeat calls
+# into one dict lookup. Invalid inputs raise and are never cached.
+@lru_cache(maxsize=256)
 def normalize_department(value: str) -> str:
     raw = (value or "").strip()
     if not raw:
         return DEPARTMENT_OPTIONS[0]
-    normalized = raw.casefold()
-    for option in DEPARTMENT_OPTIONS:
-        if option.casefold() == normalized:
-            return option
+    matched = _DEPT_LOOKUP.get(raw.casefold())
+    if matched is not None:
+        return matched
     allowed = "|".join(DEPARTMENT_OPTIONS)
     raise HTTPException(status_code=400, detail=f"department must be one of: {allowed}")
 
 
+# Serializes tag generation within this process so two concurrent creates do
+# not both read the same MAX; matches the pre-existing single-worker guarantee.
+_asset_tag_lock = threading.Lock()
+
+
 def build_next_asset_tag(db: Session) -> str:
-    tags = db.scalars(select(Asset.asset_tag)).all()
-    highest = 0
-    pattern = re.compile(r"^TDC-(\d{4,})$", re.IGNORECASE)
-    for tag in tags:
-        match = pattern.match((tag or "").strip())
-        if not match:
-            continue
-        value = int(match.group(1))
-        if value > highest:
-            highest = value
+    # POSIX regexes have no inline case flag, hence the character classes.
+    tag_number = func.substring(func.btrim(Asset.asset_tag), r"^[Tt][Dd][Cc]-([0-9]{4,})$")
+    with _asset_tag_lock:
+        highest = db.scalar(select(func.coalesce(func.max(func.cast(tag_number, Integer)), 0)))
     return f"TDC-{highest + 1:04d}"
 
 
+@lru_cache(maxsize=16)
 def normalize_qr_class(value: str | None) -> str:
     qr_class = (value or "A").strip().upper()
     if qr_class not in ("A", "B", "C"):
@@ -231,8 +235,11 @@ def normalize_qr_class(value: str | None) -> str:
     return qr_class
 
 
+_ASSET_TAG_RE = re.compile(r"^TDC-(\d{4,})$", re.IGNORECASE)
+
+
 def build_qr_code_from_asset_tag(asset_tag: str, qr_class: str) -> str:
-    tag_match = re.match(r"^TDC-(\d{4,})$", (asset_tag or "").strip(), flags=re.IGNORECASE)
+    tag_match = _ASSET_TAG_RE.match((asset_tag or "").strip())
     if not tag_match:
         raise HTTPException(status_code=400, detail="assetTag must match TDC-####")
     consecutive = int(tag_match.group(1))
@@ -255,10 +262,41 @@ def username_from_email(value: str) -> str:
     return email.split("@", 1)[0].upper()
 
 
+_ZERO_OFFSET = timedelta(0)
+
+
 def to_iso(value: datetime) -> str:
+    # timestamptz columns come back already in UTC; skip the astimezone
+    # allocation in that common case.
+    if value.utcoffset() == _ZERO_OFFSET:
+        return value.isoformat()
     return value.astimezone(timezone.utc).isoformat()
 
 
+def parse_iso_datetime_or_now(value: str | None) -> datetime:
+    # Lenient variant for client-supplied timestamps: bad input falls back
+    # to now instead of rejecting the request.
+    if value:
+        try:
+            parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            pass
+        else:
+            if parsed.tzinfo is None:
+                parsed = parsed.replace(tzinfo=timezone.utc)
+            return parsed
+    return datetime.now(timezone.utc)
+
+
+def get_by_uuid(db: Session, model, item_id: str | None):
+    # Identity-map lookup for client-supplied ids. ``db.get`` binds the key
+    # through the mapper's cached criteria, bypassing the column comparator,
+    # so a malformed id has to be rejected here instead of at the cast.
+    if not item_id or not is_uuid_text(item_id):
+        return None
+    return db.get(model, item_id)
+
+
 def get_request_id(request: Request | None) -> str:
     if request is None:
         return str(uuid.uuid4())
@@ -297,11 +335,11 @@ def _sanitize_audit_payload(value: object, depth: int = 0) -> object:
 
 def sanitize_audit_payload(payload: dict[str, object] | None) -> str:
     normalized = _sanitize_audit_payload(payload or {})
-    raw = json.dumps(normalized, ensure_ascii=True)
+    raw = orjson.dumps(normalized).decode()
     if len(raw) <= AUDIT_PAYLOAD_JSON_MAX:
         return raw
     preview = _truncate_text(raw, AUDIT_PAYLOAD_JSON_MAX - 64)
-    return json.dumps({"truncated": True, "preview": preview}, ensure_ascii=True)
+    return orjson.dumps({"truncated": True, "preview": preview}).decode()
 
 
 def diff_fields(before: dict[str, object], after: dict[str, object]) -> dict[str, dict[str, object]]:
@@ -353,6 +391,7 @@ def normalize_assigned_user(value: str | None) -> str:
     return assigned if assigned else UNASSIGNED_USER_LABEL
 
 
+@lru_cache(maxsize=64)
 def normalize_ticket_category(value: str) -> str:
     category = (value or "").strip().lower()
     if category not in TICKET_CATEGORY_VALUES:
@@ -361,6 +400,7 @@ def normalize_ticket_category(value: str) -> str:
     return category
 
 
+@lru_cache(maxsize=64)
 def normalize_ticket_priority(value: str) -> str:
     priority = (value or "").strip().lower()
     if priority not in TICKET_PRIORITY_VALUES:
@@ -369,6 +409,7 @@ def normalize_ticket_priority(value: str) -> str:
     return priority
 
 
+@lru_cache(maxsize=64)
 def normalize_ticket_status(value: str) -> str:
     status_value = (value or "").strip().lower()
     if status_value not in TICKET_STATUS_VALUES:
@@ -406,11 +447,13 @@ def compute_ticket_sla_state(ticket: Ticket) -> str:
 
 
 def log_ticket_event(db: Session, ticket: Ticket, actor_id: str | None, event_type: str, payload: dict[str, object] | None = None) -> None:
+    # Linking via the relationship lets the unit of work order the INSERTs,
+    # so callers do not need to flush the ticket first to obtain its id.
     event = TicketEvent(
-        ticket_id=ticket.id,
+        ticket=ticket,
         actor_id=actor_id,
         event_type=event_type,
-        payload_json=json.dumps(payload or {}),
+        payload_json=payload or {},
     )
     db.add(event)
 
@@ -420,7 +463,7 @@ def log_asset_event(db: Session, asset_id: str, actor_id: str | None, event_type
         asset_id=asset_id,
         actor_id=actor_id,
         event_type=event_type,
-        payload_json=json.dumps(payload or {}),
+        payload_json=payload or {},
     )
     db.add(event)
 
@@ -479,6 +522,14 @@ def ensure_module_access(current_user: User, db: Session, module_name: str) -> N
         raise HTTPException(status_code=403, detail=f"Module '{normalized_module}' is disabled for role '{current_user.role}'")
 
 
+# Roles that see every owner's rows instead of just their own.
+ELEVATED_ROLES: frozenset[str] = frozenset({UserRole.admin.value, UserRole.developer.value})
+
+
+def has_elevated_role(user: User) -> bool:
+    return user.role in ELEVATED_ROLES
+
+
 def require_admin(current_user: User = Depends(get_current_user)) -> User:
     if current_user.role != UserRole.admin.value:
         raise HTTPException(status_code=403, detail="Admin role required")
@@ -486,7 +537,7 @@ def require_admin(current_user: User = Depends(get_current_user)) -> User:
 
 
 def require_developer_or_admin(current_user: User = Depends(get_current_user)) -> User:
-    if current_user.role not in (UserRole.admin.value, UserRole.developer.value):
+    if not has_elevated_role(current_user):
         raise HTTPException(status_code=403, detail="Developer or admin role required")
     return current_user
 
@@ -536,12 +587,15 @@ def require_team_assets_access(current_user: User = Depends(require_developer_or
     return current_user
 
 
+# The *_to_out serializers build response models with model_construct: the
+# values come straight from our own rows, so the pydantic validation pass
+# adds cost without catching anything. Input models keep full validation.
 def project_to_out(project: Project) -> ProjectOut:
-    return ProjectOut(id=project.id, name=project.name, description=project.description, createdAt=to_iso(project.created_at))
+    return ProjectOut.model_construct(id=project.id, name=project.name, description=project.description, createdAt=to_iso(project.created_at))
 
 
 def task_to_out(task: Task) -> TaskOut:
-    return TaskOut(
+    return TaskOut.model_construct(
         id=task.id,
         title=task.title,
         details=task.details,
@@ -556,7 +610,7 @@ def task_to_out(task: Task) -> TaskOut:
 
 
 def note_to_out(note: Note) -> NoteOut:
-    return NoteOut(
+    return NoteOut.model_construct(
         id=note.id,
         title=note.title,
         content=note.content,
@@ -566,7 +620,7 @@ def note_to_out(note: Note) -> NoteOut:
 
 
 def team_event_to_out(event: TeamEvent) -> TeamEventOut:
-    return TeamEventOut(
+    return TeamEventOut.model_construct(
         id=event.id,
         title=event.title,
         eventDate=event.event_date.isoformat(),
@@ -577,31 +631,21 @@ def team_event_to_out(event: TeamEvent) -> TeamEventOut:
     )
 
 
-def ticket_to_out(ticket: Ticket, db: Session) -> TicketOut:
-    requester = db.get(User, ticket.requester_id)
-    fixed_by = db.get(User, ticket.fixed_by_id) if ticket.fixed_by_id else None
-    assignee = db.get(User, ticket.assignee_id) if ticket.assignee_id else None
-    evidence_items: list[TicketEvidenceOut] = []
-    if ticket.evidence_json:
-        try:
-            raw_items = json.loads(ticket.evidence_json)
-            if isinstance(raw_items, list):
-                for raw in raw_items:
-                    if not isinstance(raw, dict):
-                        continue
-                    created_at = str(raw.get("createdAt") or to_iso(datetime.now(timezone.utc)))
-                    evidence_items.append(
-                        TicketEvidenceOut(
-                            id=str(raw.get("id") or str(uuid.uuid4())),
-                            text=str(raw.get("text") or ""),
-                            imageData=str(raw.get("imageData")) if raw.get("imageData") else None,
-                            imageName=str(raw.get("imageName")) if raw.get("imageName") else None,
-                            createdAt=created_at,
-                        )
-                    )
-        except json.JSONDecodeError:
-            evidence_items = []
-    return TicketOut(
+def ticket_to_out(ticket: Ticket) -> TicketOut:
+    requester = ticket.requester
+    fixed_by = ticket.fixed_by
+    assignee = ticket.assignee
+    evidence_items = [
+        TicketEvidenceOut.model_construct(
+            id=row.id,
+            text=row.text,
+            imageData=row.image_data,
+            imageName=row.image_name,
+            createdAt=to_iso(row.created_at),
+        )
+        for row in ticket.evidence
+    ]
+    return TicketOut.model_construct(
         id=ticket.id,
         requesterId=ticket.requester_id,
         requesterEmail=requester.email if requester else "",
@@ -633,15 +677,8 @@ def ticket_event_to_out(event: TicketEvent, db: Session) -> TicketEventOut:
     if event.actor_id:
         actor = db.get(User, event.actor_id)
         actor_email = actor.email if actor else None
-    payload: dict[str, object] = {}
-    if event.payload_json:
-        try:
-            raw = json.loads(event.payload_json)
-            if isinstance(raw, dict):
-                payload = raw
-        except json.JSONDecodeError:
-            payload = {}
-    return TicketEventOut(
+    payload = event.payload_json if isinstance(event.payload_json, dict) else {}
+    return TicketEventOut.model_construct(
         id=event.id,
         ticketId=event.ticket_id,
         actorId=event.actor_id,
@@ -653,7 +690,7 @@ def ticket_event_to_out(event: TicketEvent, db: Session) -> TicketEventOut:
 
 
 def maintenance_to_out(record: MaintenanceRecord) -> MaintenanceRecordOut:
-    return MaintenanceRecordOut(
+    return MaintenanceRecordOut.model_construct(
         id=record.id,
         maintenanceDate=record.maintenance_date.isoformat(),
         qr=record.qr,
@@ -666,7 +703,7 @@ def maintenance_to_out(record: MaintenanceRecord) -> MaintenanceRecordOut:
         location=record.location,
         responsibleName=record.responsible_name,
         checks=[
-            MaintenanceCheckPayload(
+            MaintenanceCheckPayload.model_construct(
                 id=item.id,
                 label=item.label,
                 category=item.category,
@@ -680,12 +717,12 @@ def maintenance_to_out(record: MaintenanceRecord) -> MaintenanceRecordOut:
 
 
 def article_to_out(article: KnowledgeArticle) -> KnowledgeArticleOut:
-    return KnowledgeArticleOut(
+    return KnowledgeArticleOut.model_construct(
         id=article.id,
         title=article.title,
         summary=article.summary,
         content=article.content,
-        tags=parse_tags(article.tags),
+        tags=article.tags or [],
         createdAt=to_iso(article.created_at),
         updatedAt=to_iso(article.updated_at),
     )
@@ -693,7 +730,7 @@ def article_to_out(article: KnowledgeArticle) -> KnowledgeArticleOut:
 
 def asset_to_out(asset: Asset) -> AssetOut:
     assigned_user = normalize_assigned_user(asset.user_name)
-    return AssetOut(
+    return AssetOut.model_construct(
         id=asset.id,
         assetTag=asset.asset_tag,
         qrCode=asset.qr_code,
@@ -717,15 +754,8 @@ def asset_event_to_out(event: AssetEvent, db: Session) -> AssetEventOut:
     if event.actor_id:
         actor = db.get(User, event.actor_id)
         actor_email = actor.email if actor else None
-    payload: dict[str, object] = {}
-    if event.payload_json:
-        try:
-            raw = json.loads(event.payload_json)
-            if isinstance(raw, dict):
-                payload = raw
-        except json.JSONDecodeError:
-            payload = {}
-    return AssetEventOut(
+    payload = event.payload_json if isinstance(event.payload_json, dict) else {}
+    return AssetEventOut.model_construct(
         id=event.id,
         assetId=event.asset_id,
         actorId=event.actor_id,
@@ -740,12 +770,12 @@ def audit_log_to_out(log: AuditLog) -> AuditLogOut:
     payload: dict[str, object] = {}
     if log.payload_json:
         try:
-            raw = json.loads(log.payload_json)
+            raw = orjson.loads(log.payload_json)
             if isinstance(raw, dict):
                 payload = raw
-        except json.JSONDecodeError:
+        except orjson.JSONDecodeError:
             payload = {"raw": _truncate_text(log.payload_json, 500)}
-    return AuditLogOut(
+    return AuditLogOut.model_construct(
         id=log.id,
         createdAt=to_iso(log.created_at),
         actorUserId=log.actor_user_id,
@@ -761,19 +791,22 @@ def audit_log_to_out(log: AuditLog) -> AuditLogOut:
     )
 
 
-def person_to_out(person: Person) -> PersonOut:
+def person_to_out(person: Person, db: Session, linked_emails: dict[str, str] | None = None) -> PersonOut:
+    # List endpoints pass a prefetched linked_emails map so no per-person
+    # query runs; single-object paths resolve the email on the request session.
     linked_user_email: str | None = None
     if person.user_id:
-        with SessionLocal() as db:
-            linked_user = db.get(User, person.user_id)
-            linked_user_email = linked_user.email if linked_user else None
+        if linked_emails is not None:
+            linked_user_email = linked_emails.get(person.user_id)
+        else:
+            linked_user_email = db.scalar(select(User.email).where(User.id == person.user_id))
     normalized_role = (person.role or "").strip().lower()
     role_value = normalized_role if normalized_role in (UserRole.admin.value, UserRole.developer.value, UserRole.user.value) else UserRole.user.value
     try:
         department_value = normalize_department(person.job_department)
     except HTTPException:
         department_value = DEPARTMENT_OPTIONS[0]
-    return PersonOut(
+    return PersonOut.model_construct(
         id=person.id,
         userId=person.user_id,
         userEmail=linked_user_email,
@@ -5,24 +5,62 @@ import uuid
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
-from sqlalchemy import select, text
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import insert, select, text
 
 try:
-    from .core import Base, DEFAULT_ROLE_MODULE_ACCESS, MODULE_NAMES, RoleModuleAccess, SessionLocal, User, UserRole, engine, hash_password
+    from .core import (
+        ASSET_STATUS_VALUES,
+        Base,
+        DEFAULT_ROLE_MODULE_ACCESS,
+        MODULE_NAMES,
+        RoleModuleAccess,
+        SessionLocal,
+        TICKET_CATEGORY_VALUES,
+        TICKET_PRIORITY_VALUES,
+        TICKET_STATUS_VALUES,
+        User,
+        UserRole,
+        engine,
+        hash_password,
+    )
 except ImportError:
-    from core import Base, DEFAULT_ROLE_MODULE_ACCESS, MODULE_NAMES, RoleModuleAccess, SessionLocal, User, UserRole, engine, hash_password
+    from core import (
+        ASSET_STATUS_VALUES,
+        Base,
+        DEFAULT_ROLE_MODULE_ACCESS,
+        MODULE_NAMES,
+        RoleModuleAccess,
+        SessionLocal,
+        TICKET_CATEGORY_VALUES,
+        TICKET_PRIORITY_VALUES,
+        TICKET_STATUS_VALUES,
+        User,
+        UserRole,
+        engine,
+        hash_password,
+    )
 
 
-app = FastAPI(title="WorkPlatform API")
+app = FastAPI(title="WorkPlatform API", default_response_class=ORJSONResponse)
 logger = logging.getLogger(__name__)
+
+ALLOWED_ORIGINS = [origin.strip() for origin in os.getenv("ALLOWED_ORIGINS", "").split(",") if origin.strip()]
+if not ALLOWED_ORIGINS:
+    # Dev fallback: the Vite dev server and the docker-compose frontend.
+    ALLOWED_ORIGINS = ["http://localhost:5173", "http://localhost:8080"]
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
+    allow_origins=ALLOWED_ORIGINS,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST", "PATCH", "PUT", "DELETE", "OPTIONS"],
+    allow_headers=["Authorization", "Content-Type", "X-Request-ID"],
+    max_age=86400,
 )
+# Large list payloads (knowledge base, assets, tickets) are repetitive JSON
+# that compresses well; small responses skip the deflate cost entirely.
+app.add_middleware(GZipMiddleware, minimum_size=1024)
 
 
 def _get_request_id(request: Request) -> str:
@@ -53,14 +91,14 @@ async def handle_http_exception(request: Request, exc: HTTPException):
     detail = exc.detail
     message = detail if isinstance(detail, str) else "Request failed"
     body = _error_body(message, f"http_{exc.status_code}", request_id, None if isinstance(detail, str) else detail)
-    return JSONResponse(status_code=exc.status_code, content=body, headers={"X-Request-ID": request_id})
+    return ORJSONResponse(status_code=exc.status_code, content=body, headers={"X-Request-ID": request_id})
 
 
 @app.exception_handler(RequestValidationError)
 async def handle_validation_exception(request: Request, exc: RequestValidationError):
     request_id = _get_request_id(request)
     body = _error_body("Validation error", "validation_error", request_id, exc.errors())
-    return JSONResponse(status_code=422, content=body, headers={"X-Request-ID": request_id})
+    return ORJSONResponse(status_code=422, content=body, headers={"X-Request-ID": request_id})
 
 
 @app.exception_handler(Exception)
@@ -68,7 +106,7 @@ async def handle_unexpected_exception(request: Request, exc: Exception):
     request_id = _get_request_id(request)
     logger.exception("Unhandled exception (request_id=%s)", request_id, exc_info=exc)
     body = _error_body("Internal server error", "internal_server_error", request_id)
-    return JSONResponse(status_code=500, content=body, headers={"X-Request-ID": request_id})
+    return ORJSONResponse(status_code=500, content=body, headers={"X-Request-ID": request_id})
 
 
 @app.middleware("http")
@@ -80,68 +118,375 @@ async def inject_request_id(request: Request, call_next):
     return response
 
 
+# Columns added after a table's first release, applied at startup. Keyed by
+# table; each entry is (column, DDL type/default). One information_schema
+# probe decides which are missing, so steady-state boots issue no DDL.
+_SCHEMA_COLUMNS: dict[str, list[tuple[str, str]]] = {
+    "users": [
+        ("preferred_language", "VARCHAR(5) DEFAULT 'en'"),
+        ("must_set_password", "BOOLEAN DEFAULT FALSE"),
+        ("activation_token_hash", "VARCHAR(128)"),
+        ("activation_expires_at", "TIMESTAMPTZ"),
+    ],
+    "tasks": [
+        ("completion_summary", "TEXT DEFAULT ''"),
+        ("documentation", "TEXT DEFAULT ''"),
+        ("additional_notes", "TEXT DEFAULT ''"),
+    ],
+    "tickets": [
+        ("category", "VARCHAR(50) DEFAULT 'help'"),
+        ("process_notes", "TEXT DEFAULT ''"),
+        ("evidence_json", "TEXT DEFAULT '[]'"),
+        ("assignee_id", "UUID"),
+        ("first_response_due_at", "TIMESTAMPTZ"),
+        ("resolution_due_at", "TIMESTAMPTZ"),
+        ("first_responded_at", "TIMESTAMPTZ"),
+        ("resolved_at", "TIMESTAMPTZ"),
+        ("closed_at", "TIMESTAMPTZ"),
+    ],
+    "assets": [
+        ("qr_code", "VARCHAR(250) DEFAULT ''"),
+        ("manufacturer", "VARCHAR(120) DEFAULT ''"),
+        ("model", "VARCHAR(120) DEFAULT ''"),
+        ("supplier", "VARCHAR(120) DEFAULT ''"),
+        ("user_name", "VARCHAR(250) DEFAULT ''"),
+        ("condition", "VARCHAR(120) DEFAULT ''"),
+    ],
+    "people": [
+        ("legacy_id", "INTEGER"),
+        ("user_id", "UUID"),
+        ("type", "VARCHAR(10) DEFAULT 'user'"),
+        ("role_id", "INTEGER DEFAULT 2"),
+        ("client_id", "INTEGER DEFAULT 1"),
+        ("name", "VARCHAR(128) DEFAULT ''"),
+        ("email", "VARCHAR(128) DEFAULT ''"),
+        ("title", "VARCHAR(128) DEFAULT ''"),
+        ("role", "VARCHAR(128) DEFAULT ''"),
+        ("job_department", "VARCHAR(128) DEFAULT ''"),
+        ("mobile", "VARCHAR(100) DEFAULT ''"),
+        ("password_hash_legacy", "VARCHAR(128) DEFAULT ''"),
+        ("theme", "VARCHAR(64) DEFAULT 'skin-blue'"),
+        ("sidebar", "VARCHAR(64) DEFAULT 'opened'"),
+        ("layout", "VARCHAR(64) DEFAULT ''"),
+        ("notes", "TEXT DEFAULT ''"),
+        ("signature", "TEXT DEFAULT ''"),
+        ("session_id", "VARCHAR(255) DEFAULT ''"),
+        ("reset_key", "VARCHAR(255) DEFAULT ''"),
+        ("auto_refresh", "INTEGER DEFAULT 0"),
+        ("lang", "VARCHAR(5) DEFAULT 'en'"),
+        ("avatar_info", "TEXT DEFAULT ''"),
+        ("created_at", "TIMESTAMPTZ DEFAULT NOW()"),
+        ("updated_at", "TIMESTAMPTZ DEFAULT NOW()"),
+    ],
+}
+
+
+# Timestamp defaults moved from Python lambdas to the server; existing
+# databases were provisioned without a DB-side default, so set one on every
+# column the models now expect the server to fill. Idempotent, batched like
+# the index DDL below.
+_TIMESTAMP_DEFAULT_DDL = ";\n".join(
+    (
+        "ALTER TABLE users ALTER COLUMN created_at SET DEFAULT now()",
+        "ALTER TABLE role_module_access ALTER COLUMN updated_at SET DEFAULT now()",
+        "ALTER TABLE audit_logs ALTER COLUMN created_at SET DEFAULT now()",
+        "ALTER TABLE audit_logs ALTER COLUMN retention_until SET DEFAULT now() + interval '180 days'",
+        "ALTER TABLE projects ALTER COLUMN created_at SET DEFAULT now()",
+        "ALTER TABLE tasks ALTER COLUMN created_at SET DEFAULT now()",
+        "ALTER TABLE notes ALTER COLUMN created_at SET DEFAULT now()",
+        "ALTER TABLE team_events ALTER COLUMN created_at SET DEFAULT now()",
+        "ALTER TABLE tickets ALTER COLUMN created_at SET DEFAULT now()",
+        "ALTER TABLE tickets ALTER COLUMN updated_at SET DEFAULT now()",
+        "ALTER TABLE ticket_evidence ALTER COLUMN created_at SET DEFAULT now()",
+        "ALTER TABLE ticket_events ALTER COLUMN created_at SET DEFAULT now()",
+        "ALTER TABLE maintenance_records ALTER COLUMN created_at SET DEFAULT now()",
+        "ALTER TABLE knowledge_articles ALTER COLUMN created_at SET DEFAULT now()",
+        "ALTER TABLE knowledge_articles ALTER COLUMN updated_at SET DEFAULT now()",
+        "ALTER TABLE assets ALTER COLUMN created_at SET DEFAULT now()",
+        "ALTER TABLE assets ALTER COLUMN updated_at SET DEFAULT now()",
+        "ALTER TABLE asset_events ALTER COLUMN created_at SET DEFAULT now()",
+        "ALTER TABLE people ALTER COLUMN created_at SET DEFAULT now()",
+        "ALTER TABLE people ALTER COLUMN updated_at SET DEFAULT now()",
+    )
+)
+
+
+# All idempotent index DDL goes to Postgres as one multi-statement batch,
+# a single round-trip instead of one per index. The knowledge-article tags
+# GIN index is created separately after the column-type migration.
+_INDEX_DDL = ";\n".join(
+    (
+        "CREATE INDEX IF NOT EXISTS ix_users_activation_token_hash ON users (activation_token_hash)",
+        "CREATE UNIQUE INDEX IF NOT EXISTS ux_users_email_lower ON users (lower(email))",
+        "CREATE INDEX IF NOT EXISTS ix_audit_logs_created_at_desc ON audit_logs (created_at DESC)",
+        "CREATE INDEX IF NOT EXISTS ix_audit_logs_action_created_at_desc ON audit_logs (action, created_at DESC)",
+        "CREATE INDEX IF NOT EXISTS ix_audit_logs_actor_user_id_created_at_desc ON audit_logs (actor_user_id, created_at DESC)",
+        "CREATE INDEX IF NOT EXISTS ix_audit_logs_target_created_at_desc ON audit_logs (target_type, target_id, created_at DESC)",
+        "CREATE INDEX IF NOT EXISTS ix_audit_logs_retention_until ON audit_logs (retention_until)",
+        "CREATE INDEX IF NOT EXISTS ix_tickets_assignee_id ON tickets (assignee_id)",
+        "CREATE INDEX IF NOT EXISTS ix_tickets_requester_created ON tickets (requester_id, created_at DESC)",
+        "CREATE INDEX IF NOT EXISTS ix_tickets_assignee_updated ON tickets (assignee_id, updated_at DESC)",
+        "CREATE INDEX IF NOT EXISTS ix_tickets_status_created ON tickets (status, created_at)",
+        "CREATE INDEX IF NOT EXISTS ix_tickets_unassigned_open ON tickets (created_at) "
+        "WHERE assignee_id IS NULL AND status IN ('new', 'triaged', 'in_progress', 'waiting_user', 'blocked', 'reopened')",
+        "CREATE INDEX IF NOT EXISTS ix_assets_owner_updated ON assets (owner_id, updated_at DESC)",
+        "CREATE INDEX IF NOT EXISTS ix_tasks_owner_date ON tasks (owner_id, task_date)",
+        "CREATE INDEX IF NOT EXISTS ix_notes_owner_date ON notes (owner_id, note_date)",
+        "CREATE INDEX IF NOT EXISTS ix_team_events_owner_date ON team_events (owner_id, event_date)",
+        "CREATE INDEX IF NOT EXISTS ix_projects_owner_created ON projects (owner_id, created_at DESC)",
+        "CREATE INDEX IF NOT EXISTS ix_tasks_owner_created ON tasks (owner_id, created_at DESC)",
+        "CREATE INDEX IF NOT EXISTS ix_notes_owner_created ON notes (owner_id, created_at DESC)",
+        "CREATE INDEX IF NOT EXISTS ix_team_events_owner_created ON team_events (owner_id, created_at DESC)",
+        "CREATE INDEX IF NOT EXISTS ix_ticket_events_ticket_created ON ticket_events (ticket_id, created_at)",
+        "CREATE INDEX IF NOT EXISTS ix_asset_events_asset_created ON asset_events (asset_id, created_at)",
+        "CREATE INDEX IF NOT EXISTS ix_maintenance_records_owner_created ON maintenance_records (owner_id, created_at DESC)",
+    )
+)
+
+
+def _apply_missing_columns(conn) -> set[str]:
+    existing_columns = {
+        row[0]
+        for row in conn.execute(
+            text("SELECT table_name || '.' || column_name FROM information_schema.columns WHERE table_schema = 'public'")
+        )
+    }
+    for table, columns in _SCHEMA_COLUMNS.items():
+        missing = [(name, ddl) for name, ddl in columns if f"{table}.{name}" not in existing_columns]
+        if missing:
+            clauses = ", ".join(f"ADD COLUMN IF NOT EXISTS {name} {ddl}" for name, ddl in missing)
+            conn.exec_driver_sql(f"ALTER TABLE {table} {clauses}")
+    return existing_columns
+
+
+# Seed rows flattened once at import; _seed_defaults only diffs and inserts.
+_DEFAULT_ACCESS_ROWS = [
+    {"role": role_name, "module": module_name, "enabled": bool(modules.get(module_name, True))}
+    for role_name, modules in DEFAULT_ROLE_MODULE_ACCESS.items()
+    for module_name in MODULE_NAMES
+]
+
+# Key columns that moved from VARCHAR(36) to native uuid. audit_logs.target_id
+# stays varchar (free-form) and maintenance_checks.id is a checklist slug.
+_UUID_COLUMNS = (
+    ("users", "id"),
+    ("role_module_access", "id"),
+    ("audit_logs", "id"),
+    ("audit_logs", "actor_user_id"),
+    ("projects", "id"),
+    ("projects", "owner_id"),
+    ("tasks", "id"),
+    ("tasks", "owner_id"),
+    ("tasks", "project_id"),
+    ("notes", "id"),
+    ("notes", "owner_id"),
+    ("team_events", "id"),
+    ("team_events", "owner_id"),
+    ("tickets", "id"),
+    ("tickets", "requester_id"),
+    ("tickets", "fixed_by_id"),
+    ("tickets", "assignee_id"),
+    ("ticket_evidence", "id"),
+    ("ticket_evidence", "ticket_id"),
+    ("ticket_events", "id"),
+    ("ticket_events", "ticket_id"),
+    ("ticket_events", "actor_id"),
+    ("maintenance_records", "id"),
+    ("maintenance_records", "owner_id"),
+    ("maintenance_checks", "record_id"),
+    ("knowledge_articles", "id"),
+    ("knowledge_articles", "owner_id"),
+    ("assets", "id"),
+    ("assets", "owner_id"),
+    ("asset_events", "id"),
+    ("asset_events", "asset_id"),
+    ("asset_events", "actor_id"),
+    ("people", "id"),
+    ("people", "user_id"),
+)
+
+# Bump the version whenever the migration block below changes; workers that
+# find the current version recorded skip the whole block.
+_MIGRATION_VERSION = "2026-08-evidence-backfill"
+_MIGRATION_LOCK_KEY = 727274
+
+
 @app.on_event("startup")
 def on_startup():
+    # Legacy varchar key columns must become uuid before create_all runs:
+    # the newer tables declare uuid foreign keys against users/tickets, and
+    # Postgres rejects a foreign key between uuid and varchar columns. The
+    # conversion is self-guarded by an information_schema probe, so on
+    # converted databases this transaction is a single cheap query.
+    with engine.begin() as conn:
+        conn.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": _MIGRATION_LOCK_KEY})
+        _migrate_uuid_columns(conn)
     Base.metadata.create_all(engine)
     with engine.begin() as conn:
-        conn.execute(text("ALTER TABLE users ADD COLUMN IF NOT EXISTS preferred_language VARCHAR(5) DEFAULT 'en'"))
-        conn.execute(text("ALTER TABLE users ADD COLUMN IF NOT EXISTS must_set_password BOOLEAN DEFAULT FALSE"))
-        conn.execute(text("ALTER TABLE users ADD COLUMN IF NOT EXISTS activation_token_hash VARCHAR(128)"))
-        conn.execute(text("ALTER TABLE users ADD COLUMN IF NOT EXISTS activation_expires_at TIMESTAMPTZ"))
-        conn.execute(text("CREATE INDEX IF NOT EXISTS ix_users_activation_token_hash ON users (activation_token_hash)"))
-        conn.execute(text("UPDATE users SET must_set_password = FALSE WHERE must_set_password IS NULL"))
-        conn.execute(text("CREATE INDEX IF NOT EXISTS ix_audit_logs_created_at_desc ON audit_logs (created_at DESC)"))
-        conn.execute(text("CREATE INDEX IF NOT EXISTS ix_audit_logs_action_created_at_desc ON audit_logs (action, created_at DESC)"))
-        conn.execute(text("CREATE INDEX IF NOT EXISTS ix_audit_logs_actor_user_id_created_at_desc ON audit_logs (actor_user_id, created_at DESC)"))
-        conn.execute(text("CREATE INDEX IF NOT EXISTS ix_audit_logs_target_created_at_desc ON audit_logs (target_type, target_id, created_at DESC)"))
-        conn.execute(text("CREATE INDEX IF NOT EXISTS ix_audit_logs_retention_until ON audit_logs (retention_until)"))
+        # Serialize workers on an advisory lock so only the first one of a
+        # deploy applies DDL; the lock releases with this transaction.
+        conn.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": _MIGRATION_LOCK_KEY})
+        conn.exec_driver_sql(
+            "CREATE TABLE IF NOT EXISTS schema_migrations (version TEXT PRIMARY KEY, applied_at TIMESTAMPTZ DEFAULT NOW())"
+        )
+        applied = conn.scalar(text("SELECT 1 FROM schema_migrations WHERE version = :version"), {"version": _MIGRATION_VERSION})
+        if not applied:
+            _run_migrations(conn)
+            conn.execute(
+                text("INSERT INTO schema_migrations (version) VALUES (:version) ON CONFLICT DO NOTHING"),
+                {"version": _MIGRATION_VERSION},
+            )
+        # Housekeeping that runs every boot regardless of migration state.
         conn.execute(text("DELETE FROM audit_logs WHERE retention_until < NOW()"))
-        conn.execute(text("ALTER TABLE tasks ADD COLUMN IF NOT EXISTS completion_summary TEXT DEFAULT ''"))
-        conn.execute(text("ALTER TABLE tasks ADD COLUMN IF NOT EXISTS documentation TEXT DEFAULT ''"))
-        conn.execute(text("ALTER TABLE tasks ADD COLUMN IF NOT EXISTS additional_notes TEXT DEFAULT ''"))
-        conn.execute(text("ALTER TABLE tickets ADD COLUMN IF NOT EXISTS category VARCHAR(50) DEFAULT 'help'"))
-        conn.execute(text("ALTER TABLE tickets ADD COLUMN IF NOT EXISTS process_notes TEXT DEFAULT ''"))
-        conn.execute(text("ALTER TABLE tickets ADD COLUMN IF NOT EXISTS evidence_json TEXT DEFAULT '[]'"))
-        conn.execute(text("ALTER TABLE tickets ADD COLUMN IF NOT EXISTS assignee_id VARCHAR(36)"))
-        conn.execute(text("ALTER TABLE tickets ADD COLUMN IF NOT EXISTS first_response_due_at TIMESTAMPTZ"))
-        conn.execute(text("ALTER TABLE tickets ADD COLUMN IF NOT EXISTS resolution_due_at TIMESTAMPTZ"))
-        conn.execute(text("ALTER TABLE tickets ADD COLUMN IF NOT EXISTS first_responded_at TIMESTAMPTZ"))
-        conn.execute(text("ALTER TABLE tickets ADD COLUMN IF NOT EXISTS resolved_at TIMESTAMPTZ"))
-        conn.execute(text("ALTER TABLE tickets ADD COLUMN IF NOT EXISTS closed_at TIMESTAMPTZ"))
-        conn.execute(text("CREATE INDEX IF NOT EXISTS ix_tickets_assignee_id ON tickets (assignee_id)"))
+    _seed_defaults()
+    # Pre-warm the pool so early requests do not pay connection setup.
+    warm_connections = [engine.connect() for _ in range(engine.pool.size())]
+    for connection in warm_connections:
+        connection.close()
+
+
+def _run_migrations(conn):
+    columns_before_migration = _apply_missing_columns(conn)
+    conn.exec_driver_sql(_TIMESTAMP_DEFAULT_DDL)
+    conn.exec_driver_sql(_INDEX_DDL)
+    conn.execute(text("UPDATE users SET must_set_password = FALSE WHERE must_set_password IS NULL"))
+    # One-time migration: ticket evidence now lives in ticket_evidence rows.
+    # Tickets whose evidence was already moved are skipped via NOT EXISTS.
+    # Legacy item ids came from the frontend, which falls back to
+    # Date.now() strings, so only ids that already look like a UUID are
+    # kept (the id column is native uuid); everything else — and every
+    # duplicate of an id beyond its first occurrence, which would
+    # otherwise be silently dropped by the conflict clause — gets a fresh
+    # gen_random_uuid(). The legacy column is emptied afterwards so the
+    # big blobs are written once.
+    conn.execute(
+        text(
+            "INSERT INTO ticket_evidence (id, ticket_id, text, image_data, image_name, created_at) "
+            "SELECT CASE "
+            "WHEN src.rn = 1 AND src.raw_id ~* '^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$' "
+            "THEN lower(src.raw_id) ELSE gen_random_uuid()::text END, "
+            "src.ticket_id, src.text, src.image_data, src.image_name, src.created_at "
+            "FROM ("
+            "SELECT t.id AS ticket_id, item->>'id' AS raw_id, "
+            "ROW_NUMBER() OVER (PARTITION BY lower(item->>'id') ORDER BY t.created_at) AS rn, "
+            "COALESCE(item->>'text', '') AS text, item->>'imageData' AS image_data, item->>'imageName' AS image_name, "
+            "CASE WHEN item->>'createdAt' ~ '^\\d{4}-\\d{2}-\\d{2}' THEN (item->>'createdAt')::timestamptz ELSE t.created_at END AS created_at "
+            "FROM tickets t, jsonb_array_elements(t.evidence_json::jsonb) AS item "
+            "WHERE t.evidence_json LIKE '[%' AND t.evidence_json <> '[]' "
+            "AND NOT EXISTS (SELECT 1 FROM ticket_evidence e WHERE e.ticket_id = t.id)"
+            ") AS src "
+            "ON CONFLICT (id) DO NOTHING"
+        )
+    )
+    conn.execute(text("UPDATE tickets SET evidence_json = '[]' WHERE evidence_json NOT IN ('', '[]')"))
+    # One-time migration: tags moved from comma-joined text to text[].
+    tags_type = conn.scalar(
+        text(
+            "SELECT data_type FROM information_schema.columns "
+            "WHERE table_schema = 'public' AND table_name = 'knowledge_articles' AND column_name = 'tags'"
+        )
+    )
+    if tags_type == "text":
+        conn.execute(text("ALTER TABLE knowledge_articles ALTER COLUMN tags TYPE text[] USING string_to_array(tags, ',')"))
+    conn.execute(text("CREATE INDEX IF NOT EXISTS ix_knowledge_articles_tags ON knowledge_articles USING gin (tags)"))
+    # One-time migration: closed-vocabulary columns moved to native enums.
+    # Unknown legacy values fall back to the column's default rather than
+    # failing the cast. The dropped ticket indexes reference status and are
+    # recreated by re-running the (idempotent) index batch afterwards.
+    ticket_status_type = conn.scalar(
+        text(
+            "SELECT data_type FROM information_schema.columns "
+            "WHERE table_schema = 'public' AND table_name = 'tickets' AND column_name = 'status'"
+        )
+    )
+    if ticket_status_type == "character varying":
         conn.execute(text("UPDATE tickets SET status = 'new' WHERE status = 'open'"))
-        conn.execute(text("ALTER TABLE assets ADD COLUMN IF NOT EXISTS qr_code VARCHAR(250) DEFAULT ''"))
-        conn.execute(text("ALTER TABLE assets ADD COLUMN IF NOT EXISTS manufacturer VARCHAR(120) DEFAULT ''"))
-        conn.execute(text("ALTER TABLE assets ADD COLUMN IF NOT EXISTS model VARCHAR(120) DEFAULT ''"))
-        conn.execute(text("ALTER TABLE assets ADD COLUMN IF NOT EXISTS supplier VARCHAR(120) DEFAULT ''"))
-        conn.execute(text("ALTER TABLE assets ADD COLUMN IF NOT EXISTS user_name VARCHAR(250) DEFAULT ''"))
-        conn.execute(text("ALTER TABLE assets ADD COLUMN IF NOT EXISTS condition VARCHAR(120) DEFAULT ''"))
+        conn.exec_driver_sql("DROP INDEX IF EXISTS ix_tickets_status_created")
+        conn.exec_driver_sql("DROP INDEX IF EXISTS ix_tickets_unassigned_open")
+        enum_columns = (
+            ("tickets", "status", "ticket_status", TICKET_STATUS_VALUES, "new"),
+            ("tickets", "priority", "ticket_priority", TICKET_PRIORITY_VALUES, "medium"),
+            ("tickets", "category", "ticket_category", TICKET_CATEGORY_VALUES, "help"),
+            ("assets", "status", "asset_status", ASSET_STATUS_VALUES, "active"),
+        )
+        for table, column, enum_name, values, fallback in enum_columns:
+            quoted = ", ".join(f"'{value}'" for value in values)
+            conn.exec_driver_sql(
+                f"DO $$ BEGIN CREATE TYPE {enum_name} AS ENUM ({quoted}); "
+                "EXCEPTION WHEN duplicate_object THEN NULL; END $$"
+            )
+            conn.exec_driver_sql(
+                f"ALTER TABLE {table} ALTER COLUMN {column} TYPE {enum_name} "
+                f"USING (CASE WHEN {column} IN ({quoted}) THEN {column} ELSE '{fallback}' END)::{enum_name}"
+            )
+        conn.exec_driver_sql(_INDEX_DDL)
+    # One-time migration: event payloads moved from TEXT to JSONB so reads
+    # hand the app a dict without a parse step.
+    payload_type = conn.scalar(
+        text(
+            "SELECT data_type FROM information_schema.columns "
+            "WHERE table_schema = 'public' AND table_name = 'ticket_events' AND column_name = 'payload_json'"
+        )
+    )
+    if payload_type == "text":
+        for event_table in ("ticket_events", "asset_events"):
+            conn.exec_driver_sql(
+                f"ALTER TABLE {event_table} ALTER COLUMN payload_json TYPE jsonb "
+                f"USING COALESCE(NULLIF(payload_json, ''), '{{}}')::jsonb"
+            )
+    # One-time backfill, only when the user_name column was just added,
+    # so steady-state boots skip two full-table scans.
+    if "assets.user_name" not in columns_before_migration:
         conn.execute(text("UPDATE assets SET user_name = 'Unassigned' WHERE btrim(coalesce(user_name, '')) = ''"))
         conn.execute(text("UPDATE assets SET assigned_to = 'Unassigned' WHERE btrim(coalesce(assigned_to, '')) = ''"))
-        conn.execute(text("ALTER TABLE people ADD COLUMN IF NOT EXISTS legacy_id INTEGER"))
-        conn.execute(text("ALTER TABLE people ADD COLUMN IF NOT EXISTS user_id VARCHAR(36)"))
-        conn.execute(text("ALTER TABLE people ADD COLUMN IF NOT EXISTS type VARCHAR(10) DEFAULT 'user'"))
-        conn.execute(text("ALTER TABLE people ADD COLUMN IF NOT EXISTS role_id INTEGER DEFAULT 2"))
-        conn.execute(text("ALTER TABLE people ADD COLUMN IF NOT EXISTS client_id INTEGER DEFAULT 1"))
-        conn.execute(text("ALTER TABLE people ADD COLUMN IF NOT EXISTS name VARCHAR(128) DEFAULT ''"))
-        conn.execute(text("ALTER TABLE people ADD COLUMN IF NOT EXISTS email VARCHAR(128) DEFAULT ''"))
-        conn.execute(text("ALTER TABLE people ADD COLUMN IF NOT EXISTS title VARCHAR(128) DEFAULT ''"))
-        conn.execute(text("ALTER TABLE people ADD COLUMN IF NOT EXISTS role VARCHAR(128) DEFAULT ''"))
-        conn.execute(text("ALTER TABLE people ADD COLUMN IF NOT EXISTS job_department VARCHAR(128) DEFAULT ''"))
-        conn.execute(text("ALTER TABLE people ADD COLUMN IF NOT EXISTS mobile VARCHAR(100) DEFAULT ''"))
-        conn.execute(text("ALTER TABLE people ADD COLUMN IF NOT EXISTS password_hash_legacy VARCHAR(128) DEFAULT ''"))
-        conn.execute(text("ALTER TABLE people ADD COLUMN IF NOT EXISTS theme VARCHAR(64) DEFAULT 'skin-blue'"))
-        conn.execute(text("ALTER TABLE people ADD COLUMN IF NOT EXISTS sidebar VARCHAR(64) DEFAULT 'opened'"))
-        conn.execute(text("ALTER TABLE people ADD COLUMN IF NOT EXISTS layout VARCHAR(64) DEFAULT ''"))
-        conn.execute(text("ALTER TABLE people ADD COLUMN IF NOT EXISTS notes TEXT DEFAULT ''"))
-        conn.execute(text("ALTER TABLE people ADD COLUMN IF NOT EXISTS signature TEXT DEFAULT ''"))
-        conn.execute(text("ALTER TABLE people ADD COLUMN IF NOT EXISTS session_id VARCHAR(255) DEFAULT ''"))
-        conn.execute(text("ALTER TABLE people ADD COLUMN IF NOT EXISTS reset_key VARCHAR(255) DEFAULT ''"))
-        conn.execute(text("ALTER TABLE people ADD COLUMN IF NOT EXISTS auto_refresh INTEGER DEFAULT 0"))
-        conn.execute(text("ALTER TABLE people ADD COLUMN IF NOT EXISTS lang VARCHAR(5) DEFAULT 'en'"))
-        conn.execute(text("ALTER TABLE people ADD COLUMN IF NOT EXISTS avatar_info TEXT DEFAULT ''"))
-        conn.execute(text("ALTER TABLE people ADD COLUMN IF NOT EXISTS created_at TIMESTAMPTZ DEFAULT NOW()"))
-        conn.execute(text("ALTER TABLE people ADD COLUMN IF NOT EXISTS updated_at TIMESTAMPTZ DEFAULT NOW()"))
+
+
+def _migrate_uuid_columns(conn):
+    # One-time migration: key columns moved from VARCHAR(36) to native uuid.
+    # Runs from on_startup before create_all so tables that do not exist yet
+    # are created uuid-typed against already-converted referents. FK
+    # constraints block in-place type changes, so every foreign key is
+    # dropped, the columns are converted, and the saved definitions re-added
+    # inside the same transaction. NULLIF maps legacy empty strings to NULL
+    # instead of failing the cast.
+    varchar_columns = {
+        (row[0], row[1])
+        for row in conn.execute(
+            text(
+                "SELECT table_name, column_name FROM information_schema.columns "
+                "WHERE table_schema = 'public' AND data_type = 'character varying'"
+            )
+        )
+    }
+    pending = [(table, column) for table, column in _UUID_COLUMNS if (table, column) in varchar_columns]
+    if not pending:
+        return
+    # Evidence ids historically came from the frontend and were not always
+    # UUIDs; regenerate any the cast would reject. Only applies to databases
+    # from the varchar-era of the table — on older schemas it does not exist
+    # yet and is created uuid-typed by create_all.
+    if ("ticket_evidence", "id") in pending:
+        conn.execute(
+            text(
+                "UPDATE ticket_evidence SET id = gen_random_uuid()::text "
+                "WHERE id !~* '^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$'"
+            )
+        )
+    foreign_keys = conn.execute(
+        text(
+            "SELECT conrelid::regclass::text, conname, pg_get_constraintdef(oid) "
+            "FROM pg_constraint WHERE contype = 'f' AND connamespace = 'public'::regnamespace"
+        )
+    ).all()
+    for table, name, _ in foreign_keys:
+        conn.exec_driver_sql(f'ALTER TABLE {table} DROP CONSTRAINT "{name}"')
+    for table, column in pending:
+        conn.exec_driver_sql(f"ALTER TABLE {table} ALTER COLUMN {column} TYPE uuid USING NULLIF({column}, '')::uuid")
+    for table, name, definition in foreign_keys:
+        conn.exec_driver_sql(f'ALTER TABLE {table} ADD CONSTRAINT "{name}" {definition}')
+
+
+def _seed_defaults():
     with SessionLocal() as db:
         existing = db.scalar(select(User).where(User.email == "admin@workplatform.local"))
         if not existing:
@@ -157,23 +502,10 @@ def on_startup():
             )
             db.add(admin)
             db.flush()
-        for role_name, modules in DEFAULT_ROLE_MODULE_ACCESS.items():
-            for module_name in MODULE_NAMES:
-                existing_rule = db.scalar(
-                    select(RoleModuleAccess).where(
-                        RoleModuleAccess.role == role_name,
-                        RoleModuleAccess.module == module_name,
-                    )
-                )
-                if existing_rule:
-                    continue
-                db.add(
-                    RoleModuleAccess(
-                        role=role_name,
-                        module=module_name,
-                        enabled=bool(modules.get(module_name, True)),
-                    )
-                )
+        existing_pairs = set(db.execute(select(RoleModuleAccess.role, RoleModuleAccess.module)).all())
+        missing_rules = [row for row in _DEFAULT_ACCESS_ROWS if (row["role"], row["module"]) not in existing_pairs]
+        if missing_rules:
+            db.execute(insert(RoleModuleAccess), missing_rules)
         db.commit()
 
 
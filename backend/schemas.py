@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 
 try:
     from .models import UserRole
@@ -128,6 +128,17 @@ class PersonIn(BaseModel):
     mobile: str = ""
     notes: str = ""
 
+    # Normalize once at parse time so the handlers work with clean values.
+    @field_validator("name", "title", "mobile", "notes")
+    @classmethod
+    def _strip(cls, value: str) -> str:
+        return value.strip()
+
+    @field_validator("email")
+    @classmethod
+    def _normalize_email(cls, value: str) -> str:
+        return value.strip().lower()
+
 
 class PersonOut(BaseModel):
     id: str
@@ -375,6 +386,21 @@ class AssetIn(BaseModel):
     condition: str = ""
     notes: str = ""
 
+    @field_validator("location", "category", "manufacturer", "model", "supplier", "condition", "notes")
+    @classmethod
+    def _strip(cls, value: str) -> str:
+        return value.strip()
+
+    @field_validator("serialNumber")
+    @classmethod
+    def _normalize_serial(cls, value: str) -> str:
+        return value.strip().upper()
+
+    @field_validator("status")
+    @classmethod
+    def _normalize_status(cls, value: str) -> str:
+        return value.strip().lower()
+
 
 class AssetOut(BaseModel):
     id: str